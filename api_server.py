@@ -17,7 +17,6 @@ Endpoints:
 
 import os
 import sys
-import json
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -31,7 +30,7 @@ import uvicorn
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from data_analyst import DataAnalyst
+from data_analyst import DataAnalyst, HISTORY_DIR, load_history
 
 
 class Settings(BaseSettings):
@@ -106,6 +105,17 @@ app.add_middleware(
 # In-memory storage for reports (in production, use a database)
 reports_store: Dict[str, Dict[str, Any]] = {}
 
+# Shared analyst for trend math on read endpoints, created on first use
+_trend_analyst: Optional[DataAnalyst] = None
+
+
+def _get_trend_analyst() -> DataAnalyst:
+    """The shared DataAnalyst used by /api/trends"""
+    global _trend_analyst
+    if _trend_analyst is None:
+        _trend_analyst = DataAnalyst()
+    return _trend_analyst
+
 
 @app.get("/")
 async def root():
@@ -219,24 +229,17 @@ async def get_report(site: str):
     """
     if site not in reports_store:
         # Try to load from file
-        site_clean = (
-            site.replace("https://", "").replace("http://", "").replace("www.", "")
-        )
-        history_file = Path(__file__).parent / "history" / f"history_{site_clean}.json"
-
-        if history_file.exists():
-            try:
-                with open(history_file, "r") as f:
-                    history = json.load(f)
-                    if history:
-                        # Return the most recent
-                        return {
-                            "success": True,
-                            "data": history[-1]["report"],
-                            "site": site,
-                        }
-            except Exception:
-                pass
+        try:
+            history = load_history(site)
+            if history:
+                # Return the most recent
+                return {
+                    "success": True,
+                    "data": history[-1]["report"],
+                    "site": site,
+                }
+        except Exception:
+            pass
 
         raise HTTPException(status_code=404, detail=f"No report found for site: {site}")
 
@@ -252,18 +255,14 @@ async def get_trends(site: str):
         site: Site domain
     """
     # Load historical data
-    site_clean = site.replace("https://", "").replace("http://", "").replace("www.", "")
-    history_file = Path(__file__).parent / "history" / f"history_{site_clean}.json"
+    history = load_history(site)
 
-    if not history_file.exists():
+    if not history:
         raise HTTPException(
             status_code=404, detail=f"No historical data found for: {site}"
         )
 
     try:
-        with open(history_file, "r") as f:
-            history = json.load(f)
-
         if len(history) < 2:
             return {
                 "success": False,
@@ -272,8 +271,7 @@ async def get_trends(site: str):
             }
 
         # Calculate trends
-        analyst = DataAnalyst()
-        trends = analyst.analyze_trends(site)
+        trends = _get_trend_analyst().analyze_trends(site, history)
 
         return {"success": True, "data": trends, "history_count": len(history)}
 
@@ -289,11 +287,14 @@ async def list_sites():
     sites = []
 
     # Check history directory
-    history_dir = Path(__file__).parent / "history"
+    history_dir = HISTORY_DIR
     if history_dir.exists():
-        for file in history_dir.glob("history_*.json"):
-            site_name = file.stem.replace("history_", "")
-            sites.append(site_name)
+        # JSON Lines files, plus legacy list-JSON files not yet migrated
+        for pattern in ("history_*.jsonl", "history_*.json"):
+            for file in history_dir.glob(pattern):
+                site_name = file.stem.replace("history_", "")
+                if site_name not in sites:
+                    sites.append(site_name)
 
     return {"success": True, "sites": sites, "count": len(sites)}
 
@@ -21,16 +21,362 @@ import os
 import sys
 import json
 import time
+import argparse
+import io
+import re
+import gzip
+import base64
+import shutil
+import hashlib
+import calendar
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from heapq import nsmallest
+from itertools import islice
 import subprocess
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
 load_dotenv()
 
+# Runs the blocking OpenRouter request while the dashboard renders
+_AI_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-insights")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space indented JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Parses the first JSON object out of free-form model output
+_JSON_DECODER = json.JSONDecoder()
+
+# Placeholder OpenRouter key; treated the same as no key being configured
+_OPENROUTER_PLACEHOLDER_KEY = "sk-or-v1-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+
+# Recommendation priority -> CSS modifier class on the executive dashboard
+_REC_PRIORITY_CLASS = {"Critical": "high", "High": "high", "Growth": "growth"}
+
+# Recommendation priority -> rank; lists keep the lowest ranks first
+_PRIORITY_RANK = {"Critical": 0, "High": 1, "Growth": 2, "Medium": 3, "Low": 4}
+
+
+def _top_recommendations(recs: List[Dict], n: int = 8) -> List[Dict]:
+    """The n highest-priority recommendations, discovery order within a priority"""
+    return nsmallest(
+        n, recs, key=lambda rec: _PRIORITY_RANK.get(rec.get("priority"), 5)
+    )
+
+
+# Emoji markers stripped from recommendation text in the executive dashboard
+_REC_EMOJI = str.maketrans("", "", "📈📉🔴🎯📝🔗")
+
+
+def _strip_rec_emoji(text: str) -> str:
+    return text.translate(_REC_EMOJI).strip()
+
+
+def _gsc_js_view(gsc: Dict) -> Dict:
+    """GSC data trimmed to what the dashboard script needs"""
+    if len(gsc.get("top_queries") or ()) <= 25:
+        return gsc
+    return {**gsc, "top_queries": gsc["top_queries"][:25]}
+
+
+def _ga4_js_view(ga4: Dict) -> Dict:
+    """GA4 data trimmed to what the dashboard script needs"""
+    events = ga4.get("events")
+    if not events or len(events.get("top_events") or ()) <= 8:
+        return ga4
+    return {**ga4, "events": {**events, "top_events": events["top_events"][:8]}}
+
+
+def _metrics(data: Dict, *keys: str) -> List:
+    """data.get(key, 0) for each key, in order (for tuple unpacking)"""
+    return [data.get(key, 0) for key in keys]
+
+
+def _movement(diff: float, band: float = 0) -> int:
+    """0 if diff is below -band, 2 if above band, otherwise 1"""
+    return (diff > band) - (diff < -band) + 1
+
+
+# Trend CSS class by [inverse][sign of change + 1]
+_TREND_TABLE = (
+    ("trend-down", "trend-stable", "trend-up"),
+    ("trend-up", "trend-stable", "trend-down"),
+)
+
+
+def _trend_class(val: float, inverse: bool = False) -> str:
+    """CSS trend class for a change; inverse when a drop is the good direction"""
+    return _TREND_TABLE[inverse][(val > 0) - (val < 0) + 1]
+
+
+def _fmt_num(n: float) -> str:
+    return f"{n:,.0f}" if abs(n) >= 100 else f"{n:+.1f}"
+
+
+def _fmt_pct(p: float) -> str:
+    return f"{p:+.1f}%"
+
+
+def _insight_metrics(gsc: Dict, ga4: Dict, meta: Dict, scores: Dict) -> Dict:
+    """Metrics the _INSIGHT_RULES selectors and card text are evaluated against"""
+    top_events = (ga4.get("events") or {}).get("top_events", [])
+    return {
+        "gsc_clicks": gsc.get("total_clicks", 0),
+        "gsc_pos": gsc.get("average_position", 0),
+        "gsc_ctr": gsc.get("average_ctr", 0),
+        "ga4_sessions": ga4.get("total_sessions", 0),
+        "ga4_bounce": ga4.get("bounce_rate", 0),
+        "ga4_conversions": ga4.get("conversions", 0),
+        "conv_rate": (ga4.get("conversion_rate") or 0) * 100,
+        "top_events": top_events,
+        "event_names": ", ".join(
+            filter(None, (e.get("name") for e in islice(top_events, 5)))
+        ),
+        "meta_impressions": meta.get("total_impressions", 0),
+        "meta_er": meta.get("engagement_rate", 0),
+        "meta_fans": meta.get("total_fans", 0),
+        "overall": scores.get("overall", 0),
+    }
+
+
+def _insight_cards(ctx: Dict):
+    """Yield the (color, title, body) card each _INSIGHT_RULES group picks"""
+    for select, cards in _INSIGHT_RULES:
+        card = cards[select(ctx)]
+        if card:
+            yield card
+
+
+def _change(curr: float, prev: float) -> Tuple[float, float]:
+    """(difference, percent change) vs the previous period; 0% without a baseline"""
+    diff = curr - prev
+    return diff, (diff / prev * 100) if prev > 0 else 0
+
+
+def _month_range(
+    today: datetime, running: bool = False
+) -> Tuple[datetime, datetime, datetime, datetime]:
+    """(first, last, prev_first, prev_last) for the current month vs the previous
+
+    The current period ends today when running, else on the last day of the
+    month; the previous period starts on the 1st of last month and spans the
+    same number of days.
+    """
+    first = today.replace(day=1)
+    last = today if running else today.replace(
+        day=calendar.monthrange(today.year, today.month)[1]
+    )
+    prev_first = (first - timedelta(days=1)).replace(day=1)
+    prev_last = prev_first + (last - first)
+    return first, last, prev_first, prev_last
+
+
+def _gsc_streamlit_view(gsc: Dict) -> Dict:
+    """GSC data trimmed to the query rows the Streamlit app tabulates"""
+    if len(gsc.get("top_queries") or ()) <= 10:
+        return gsc
+    return {**gsc, "top_queries": gsc["top_queries"][:10]}
+
+
+# Report history storage, one history_<site>.jsonl file per site
+HISTORY_DIR = Path(__file__).parent / "history"
+
+
+def _history_path(data_dir: Path, site_url: str) -> Path:
+    site_name = (
+        site_url.replace("https://", "").replace("http://", "").replace("www.", "")
+    )
+    return data_dir / f"history_{site_name}.jsonl"
+
+
+def _read_history(history_file: Path) -> List[Dict]:
+    """Parse a JSON Lines history file, one record per line"""
+    with open(history_file, "rb") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def load_history(site_url: str, data_dir: Path = HISTORY_DIR) -> List[Dict]:
+    """Read a site's report history without migrating, caching or a DataAnalyst.
+
+    Falls back to a legacy list-JSON file that has not been migrated yet.
+    """
+    history_file = _history_path(data_dir, site_url)
+    try:
+        return _read_history(history_file)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        return []
+    try:
+        with open(history_file.with_suffix(".json"), "r") as f:
+            return json.load(f)
+    except Exception:
+        return []
+
+
+# Renders kept in the on-disk cache (least recently used are evicted first)
+_RENDER_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def _source_version() -> str:
+    """Hash of this module's source, so edited templates miss the render cache"""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+def _without(data: Dict, *keys: str) -> Dict:
+    """Shallow copy of data minus keys (data itself when none are present)"""
+    if not any(key in data for key in keys):
+        return data
+    return {k: v for k, v in data.items() if k not in keys}
+
+
+# Channel recommendation rules as (metric key, predicate, priority, title,
+# description); the description is formatted with the metric value. A key of
+# None marks a rule that always applies. The fallback is used when none fire.
+_GSC_REC_RULES = (
+    (
+        "average_position",
+        lambda v: v > 5,
+        "High",
+        "Improve Search Rankings",
+        "Average position is {:.1f}. Focus on content optimization and building backlinks to reach top 3.",
+    ),
+    (
+        "average_ctr",
+        lambda v: v < 0.03,
+        "High",
+        "Improve CTR",
+        "CTR is {:.2%}. Optimize title tags and meta descriptions with power words.",
+    ),
+    (
+        "positions_4_10",
+        lambda v: v > 0,
+        "Medium",
+        "Optimize Page 1 Keywords",
+        "{} queries ranking 4-10. Small improvements can boost these to top 3.",
+    ),
+)
+_GSC_REC_FALLBACK = (
+    "Low",
+    "Maintain Performance",
+    "SEO metrics look good. Continue current strategy and monitor trends.",
+)
+
+_GA4_REC_RULES = (
+    (
+        "bounce_rate",
+        lambda v: v > 0.5,
+        "High",
+        "Reduce Bounce Rate",
+        "Bounce rate is {:.1%}. Improve page speed, add engaging content, and ensure mobile responsiveness.",
+    ),
+    (
+        "conversions",
+        lambda v: v == 0,
+        "High",
+        "Set Up Conversions",
+        "No conversions tracked. Set up conversion events in GA4 for key actions (signups, purchases, form submissions).",
+    ),
+    (
+        "total_sessions",
+        lambda v: v < 100,
+        "Medium",
+        "Increase Traffic",
+        "Only {} sessions. Improve SEO and consider paid traffic to increase visitors.",
+    ),
+)
+_GA4_REC_FALLBACK = (
+    "Low",
+    "Maintain Performance",
+    "Web analytics look healthy. Continue monitoring and optimizing.",
+)
+
+_META_REC_RULES = (
+    (
+        "engagement_rate",
+        lambda v: v < 0.03,
+        "High",
+        "Boost Engagement",
+        "Engagement rate is {:.2%}. Post more videos, use polls, and ask questions.",
+    ),
+    (
+        "total_impressions",
+        lambda v: v < 10000,
+        "Medium",
+        "Increase Reach",
+        "Low impressions. Post more consistently and use relevant hashtags.",
+    ),
+    (
+        None,
+        lambda v: True,
+        "Medium",
+        "Content Strategy",
+        "Mix of content types: educational posts, behind-the-scenes, customer testimonials, and promotional content.",
+    ),
+)
+
+
+@lru_cache(maxsize=128)
+def _rule_recs(
+    rules: Tuple, values: Tuple, fallback: Optional[Tuple]
+) -> Tuple[Dict, ...]:
+    """Memoized recommendations for a rule table and metrics fingerprint"""
+    recs = tuple(
+        {
+            "priority": priority,
+            "title": title,
+            "description": description.format(value),
+        }
+        for (_, predicate, priority, title, description), value in zip(rules, values)
+        if predicate(value)
+    )
+    if recs or fallback is None:
+        return recs
+    priority, title, description = fallback
+    return ({"priority": priority, "title": title, "description": description},)
+
+
+def _apply_rules(
+    data: Dict, rules: Tuple, fallback: Optional[Tuple] = None
+) -> List[Dict]:
+    """Recommendations from the rules in a table that fire for data"""
+    values = tuple(data.get(key, 0) for key, *_ in rules)
+    return [dict(rec) for rec in _rule_recs(rules, values, fallback)]
+
 
 class DataAnalyst:
     """
@@ -99,50 +445,107 @@ class DataAnalyst:
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "DataAnalystAgent/2.0"})
 
+        # Keep-alive connection to OpenRouter, reused across AI insight calls
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        self._http.headers.update(
+            {
+                "Authorization": f"Bearer {self.openrouter_api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "https://data-analyst-agent.local",
+                "X-Title": "Data Analyst Agent",
+                "Accept-Encoding": "gzip",
+            }
+        )
+
+        # Parsed OpenRouter responses keyed on a hash of the report metrics
+        self.enable_ai_cache = True
+        self._ai_cache = {}
+
         # Historical data storage
-        self.data_dir = Path(__file__).parent / "history"
+        self.data_dir = HISTORY_DIR
         self.data_dir.mkdir(exist_ok=True)
 
+        # Parsed history files keyed by path, as (mtime_ns, entries)
+        self._history_cache = {}
+
+        # Rendered Streamlit apps keyed on their inputs (see _render_cache_path)
+        self.render_cache_dir = Path.home() / ".cache" / "data_analyst"
+
         # Default author for reports
         self.author_name = "Vincent John Rodriguez"
 
         print("📊 Data Analyst Agent v2.0 initialized")
 
+    def _history_file(self, site_url: str) -> Path:
+        return _history_path(self.data_dir, site_url)
+
+    def _migrate_history(self, history_file: Path) -> None:
+        """Convert a legacy list-JSON history file to JSON Lines (one-shot)"""
+        legacy = history_file.with_suffix(".json")
+        if history_file.exists() or not legacy.exists():
+            return
+        try:
+            with open(legacy, "r") as f:
+                history = json.load(f)
+            with open(history_file, "wb") as f:
+                f.writelines(_dumps(h) + b"\n" for h in history)
+            legacy.replace(legacy.with_suffix(".json.bak"))
+            print(f"📦 Migrated {legacy.name} to {history_file.name}")
+        except Exception as e:
+            print(f"⚠️ Could not migrate {legacy.name}: {e}")
+
     def load_historical_data(self, site_url: str) -> List[Dict]:
-        """Load historical report data"""
-        site_name = (
-            site_url.replace("https://", "").replace("http://", "").replace("www.", "")
-        )
-        history_file = self.data_dir / f"history_{site_name}.json"
+        """Load historical report data.
+
+        History is stored as JSON Lines, one record per save. The parsed file
+        is reused until its mtime changes, so the save/trends/recommendations
+        steps of one run parse it once. Treat the result as read-only.
+        """
+        history_file = self._history_file(site_url)
+        self._migrate_history(history_file)
+        try:
+            mtime = history_file.stat().st_mtime_ns
+        except OSError:
+            return []
 
-        if history_file.exists():
-            try:
-                with open(history_file, "r") as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
+        cached = self._history_cache.get(history_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            history = _read_history(history_file)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read {history_file.name}, ignoring history: {e}")
+            return []
+        self._history_cache[history_file] = (mtime, history)
+        return history
 
     def save_historical_data(self, site_url: str, report: Dict) -> None:
         """Save report to historical data"""
-        site_name = (
-            site_url.replace("https://", "").replace("http://", "").replace("www.", "")
-        )
-        history_file = self.data_dir / f"history_{site_name}.json"
+        history_file = self._history_file(site_url)
 
-        history = self.load_historical_data(site_url)
-        history.append({"date": datetime.now().isoformat(), "report": report})
+        history = list(self.load_historical_data(site_url))
+        record = {"date": datetime.now().isoformat(), "report": report}
+        history.append(record)
 
-        # Keep only last 90 days of data
+        # Keep only last 90 days of data; rewrite only when something expired
         cutoff = datetime.now() - timedelta(days=90)
-        history = [h for h in history if datetime.fromisoformat(h["date"]) > cutoff]
-
-        with open(history_file, "w") as f:
-            json.dump(history, f, indent=2)
+        if datetime.fromisoformat(history[0]["date"]) > cutoff:
+            with open(history_file, "ab") as f:
+                f.write(_dumps(record) + b"\n")
+        else:
+            history = [h for h in history if datetime.fromisoformat(h["date"]) > cutoff]
+            with open(history_file, "wb") as f:
+                f.writelines(_dumps(h) + b"\n" for h in history)
+        self._history_cache[history_file] = (history_file.stat().st_mtime_ns, history)
 
-    def analyze_trends(self, site_url: str) -> Dict[str, Any]:
-        """Analyze trends from historical data"""
-        history = self.load_historical_data(site_url)
+    def analyze_trends(
+        self, site_url: str, history: Optional[List[Dict]] = None
+    ) -> Dict[str, Any]:
+        """Analyze trends from historical data (loaded unless history is given)"""
+        if history is None:
+            history = self.load_historical_data(site_url)
 
         if len(history) < 2:
             return {
@@ -390,7 +793,7 @@ class DataAnalyst:
             ]
         )
 
-        return recommendations[:8]
+        return _top_recommendations(recommendations)
 
     def _get_default_recommendations(self) -> List[Dict]:
         """Get default recommendations for new accounts"""
@@ -1386,7 +1789,7 @@ class DataAnalyst:
                     }
                 )
 
-        return recommendations[:8]
+        return _top_recommendations(recommendations)
 
     def _generate_summary(
         self,
@@ -1480,8 +1883,7 @@ class DataAnalyst:
     def export_report(self, report: Dict, output_path: str) -> None:
         """Export report to JSON"""
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, default=str)
+            Path(output_path).write_bytes(_dumps_indented(report))
             print(f"✅ Report exported to: {output_path}")
         except Exception as e:
             print(f"❌ Export failed: {e}")
@@ -1516,6 +1918,14 @@ class DataAnalyst:
 
         days = report.get("analysis_period_days", 30)
 
+        # Start AI-powered insights first so the request overlaps local rendering
+        ai_future = None
+        if self._has_ai_key():
+            print("🤖 Generating AI-powered insights...")
+            ai_future = _AI_POOL.submit(
+                self.generate_ai_insights, gsc, ga4, meta, scores
+            )
+
         # Calculate comparison metrics for monthly report
         comparison_html = ""
         if comparison_data and report_type == "monthly":
@@ -1525,38 +1935,6 @@ class DataAnalyst:
             prev_ga4 = prev_channels.get("ga4", {})
             prev_meta = prev_channels.get("meta", {})
 
-            # Calculate differences
-            gsc_clicks_diff = gsc.get("total_clicks", 0) - prev_gsc.get(
-                "total_clicks", 0
-            )
-            gsc_clicks_pct = (
-                (gsc_clicks_diff / prev_gsc.get("total_clicks", 1)) * 100
-                if prev_gsc.get("total_clicks", 0) > 0
-                else 0
-            )
-
-            ga4_sessions_diff = ga4.get("total_sessions", 0) - prev_ga4.get(
-                "total_sessions", 0
-            )
-            ga4_sessions_pct = (
-                (ga4_sessions_diff / prev_ga4.get("total_sessions", 1)) * 100
-                if prev_ga4.get("total_sessions", 0) > 0
-                else 0
-            )
-
-            meta_impressions_diff = meta.get("total_impressions", 0) - prev_meta.get(
-                "total_impressions", 0
-            )
-            meta_impressions_pct = (
-                (meta_impressions_diff / prev_meta.get("total_impressions", 1)) * 100
-                if prev_meta.get("total_impressions", 0) > 0
-                else 0
-            )
-
-            overall_diff = scores.get("overall", 0) - prev_report.get("scores", {}).get(
-                "overall", 0
-            )
-
             comparison_html = self._generate_comparison_html(
                 gsc,
                 prev_gsc,
@@ -1575,18 +1953,6 @@ class DataAnalyst:
         else:
             final_recommendations = report.get("recommendations", [])
 
-        # Generate AI-powered insights
-        ai_insights = None
-        if (
-            self.openrouter_api_key
-            and self.openrouter_api_key
-            != "sk-or-v1-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
-        ):
-            print("🤖 Generating AI-powered insights...")
-            ai_insights = self.generate_ai_insights(gsc, ga4, meta, scores)
-            if ai_insights:
-                print("✅ AI insights integrated into dashboard")
-
         # Determine trend
         trend_html = ""
         if trends and trends.get("overall"):
@@ -1604,962 +1970,309 @@ class DataAnalyst:
             else:
                 trend_html = '<span class="trend-stable">[Stable]</span>'
 
-        # Serialize data for JavaScript
-        import json
+        # Report timestamps (single clock read so footer and date picker agree)
+        now = datetime.now()
+        now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+        today = now.strftime("%Y-%m-%d")
+        default_start = start_date or (now - timedelta(days=days or 30)).strftime(
+            "%Y-%m-%d"
+        )
+        default_end = end_date or today
+
+        # Event summary values
+        events = ga4.get("events") or {}
+        total_events = events.get("total_events", 0)
+        total_event_types = events.get("total_event_types", 0)
+        sessions_with_events = events.get("sessions_with_events", 0)
+        top_events = events.get("top_events", [])[:8]
+
+        # Serialize data for JavaScript (gzipped + base64, inflated client-side)
+        report_blob = b"".join(
+            (
+                b'{"gsc":',
+                _dumps(_gsc_js_view(gsc)),
+                b',"ga4":',
+                _dumps(_ga4_js_view(ga4)),
+                b',"meta":',
+                _dumps(meta),
+                b',"scores":',
+                _dumps(scores),
+                b',"recommendations":',
+                _dumps(final_recommendations[:10]),
+                b"}",
+            )
+        )
+        report_data_b64 = base64.b64encode(
+            gzip.compress(report_blob, compresslevel=6)
+        ).decode("ascii")
 
-        gsc_json = json.dumps(gsc, default=str)
-        ga4_json = json.dumps(ga4, default=str)
-        meta_json = json.dumps(meta, default=str)
-        scores_json = json.dumps(scores, default=str)
-        recommendations_json = json.dumps(final_recommendations[:10], default=str)
+        # Executive summary: month-over-month comparison or single-period view
+        if comparison_html:
+            exec_summary_html = comparison_html
+        else:
+            exec_summary_html = _EXEC_SUMMARY_TEMPLATE.format(
+                overall=scores.get("overall", 0),
+                clicks=gsc.get("total_clicks", 0),
+                sessions=ga4.get("total_sessions", 0),
+                impressions=meta.get("total_impressions", 0),
+            )
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{site_name} - Executive Analytics Report</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/flatpickr/dist/flatpickr.min.css">
-    <script src="https://cdn.jsdelivr.net/npm/flatpickr"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif; background: #f8f9fa; color: #1a1a1a; line-height: 1.6; }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 30px 40px; background: white; min-height: 100vh; }}
-        
-        /* Header */
-        .header {{ background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%); color: white; padding: 35px 40px; margin: -40px -40px 40px -40px; }}
-        .header-top {{ display: flex; justify-content: space-between; align-items: center; }}
-        .header h1 {{ font-size: 2.2em; font-weight: 300; letter-spacing: 1px; }}
-        .header .subtitle {{ font-size: 0.95em; opacity: 0.85; font-weight: 300; }}
-        
-        /* Filter Bar */
-        .filter-bar {{ background: #fff; border: 1px solid #e0e0e0; padding: 20px 25px; margin-bottom: 35px; display: flex; align-items: center; gap: 20px; flex-wrap: wrap; }}
-        .filter-bar label {{ font-weight: 600; color: #333; font-size: 0.9em; }}
-        .filter-bar input {{ padding: 12px 15px; font-size: 1em; border: 2px solid #1a1a1a; border-radius: 6px; width: 220px; background: #fff; cursor: pointer; }}
-        .filter-bar input:hover {{ border-color: #4a4a4a; }}
-        .filter-bar button {{ padding: 12px 30px; font-size: 1em; background: #198754; color: white; border: none; border-radius: 6px; cursor: pointer; font-weight: 600; }}
-        .filter-bar button:hover {{ background: #146c43; }}
-        .filter-info {{ color: #666; font-size: 0.9em; }}
-        
-        /* Sections */
-        .section {{ margin-bottom: 45px; }}
-        .section-title {{ font-size: 1.1em; font-weight: 600; color: #1a1a1a; border-bottom: 2px solid #1a1a1a; padding-bottom: 12px; margin-bottom: 25px; text-transform: uppercase; letter-spacing: 1.5px; }}
-        
-        /* Cards */
-        .card {{ border: 1px solid #e0e0e0; padding: 25px; margin-bottom: 20px; border-radius: 6px; }}
-        .card h2 {{ font-size: 0.95em; font-weight: 600; margin-bottom: 20px; text-transform: uppercase; letter-spacing: 1px; color: #555; border-bottom: 1px solid #eee; padding-bottom: 12px; }}
-        
-        /* Grid */
-        .grid {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; margin-bottom: 30px; }}
-        .grid-3 {{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; }}
-        .grid-2 {{ display: grid; grid-template-columns: repeat(2, 1fr); gap: 25px; }}
-        
-        /* Executive Summary */
-        .exec-summary {{ background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%); color: white; padding: 35px 40px; margin: -40px -40px 40px -40px; }}
-        .exec-summary h2 {{ color: white; border-bottom: 1px solid rgba(255,255,255,0.2); }}
-        .exec-summary .summary-grid {{ display: grid; grid-template-columns: repeat(4, 1fr); gap: 30px; margin-top: 25px; }}
-        .exec-summary .summary-item {{ text-align: center; }}
-        .exec-summary .summary-value {{ font-size: 2.8em; font-weight: 300; }}
-        .exec-summary .summary-label {{ font-size: 0.8em; opacity: 0.75; text-transform: uppercase; letter-spacing: 1px; }}
-        
-        /* Metrics */
-        .score-display {{ text-align: center; padding: 20px; }}
-        .score {{ font-size: 3em; font-weight: 300; line-height: 1; }}
-        .score-label {{ font-size: 0.8em; color: #666; text-transform: uppercase; letter-spacing: 1px; margin-top: 8px; }}
-        
-        .metric {{ display: flex; justify-content: space-between; padding: 14px 0; border-bottom: 1px solid #f0f0f0; }}
-        .metric:last-child {{ border-bottom: none; }}
-        .metric-label {{ color: #666; font-size: 0.9em; }}
-        .metric-value {{ font-weight: 600; font-size: 1.05em; }}
-        
-        /* Color classes */
-        .score-good {{ color: #198754; }}
-        .score-neutral {{ color: #6c757d; }}
-        .score-bad {{ color: #dc3545; }}
-        .metric-good {{ color: #198754; }}
-        .metric-bad {{ color: #dc3545; }}
-        .trend-up {{ color: #198754; font-weight: 600; }}
-        .trend-down {{ color: #dc3545; font-weight: 600; }}
-        .trend-stable {{ color: #6c757d; }}
-        
-        /* Charts */
-        .chart-container {{ position: relative; height: 280px; margin: 15px 0; }}
-        
-        /* Recommendations */
-        .recommendation {{ border-left: 4px solid #1a1a1a; padding: 20px 25px; margin: 18px 0; background: #fafafa; border-radius: 0 6px 6px 0; }}
-        .recommendation.high {{ border-left-color: #dc3545; background: #fff5f5; }}
-        .recommendation.growth {{ border-left-color: #198754; background: #f0fff4; }}
-        .rec-priority {{ font-size: 0.75em; font-weight: 600; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px; }}
-        .rec-title {{ font-weight: 600; margin-bottom: 10px; font-size: 1.05em; }}
-        .rec-desc {{ color: #555; font-size: 0.95em; line-height: 1.5; }}
-        .rec-action {{ margin-top: 14px; padding-top: 14px; border-top: 1px solid #ddd; font-size: 0.9em; color: #333; }}
-        
-        /* Insights */
-        .insight {{ padding: 18px 22px; margin: 12px 0; background: #f8f9fa; border-left: 3px solid #666; border-radius: 0 4px 4px 0; }}
-        
-        /* Footer */
-        .footer {{ margin-top: 50px; padding-top: 25px; border-top: 1px solid #ddd; font-size: 0.8em; color: #888; text-align: center; }}
-        
-        /* Responsive */
-        @media (max-width: 1200px) {{ .grid {{ grid-template-columns: repeat(2, 1fr); }} .exec-summary .summary-grid {{ grid-template-columns: repeat(2, 1fr); }} }}
-        @media (max-width: 768px) {{ .grid {{ grid-template-columns: 1fr; }} .grid-2 {{ grid-template-columns: 1fr; }} .container {{ padding: 20px; }} .header {{ margin: -20px -20px 30px -20px; padding: 25px; }} .filter-bar {{ flex-direction: column; align-items: stretch; }} .filter-bar input {{ width: 100%; }} }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <!-- Header -->
-        <div class="header">
-            <div class="header-top">
-                <div>
-                    <h1>{site_name}</h1>
-                    <div class="subtitle">Executive Analytics Report</div>
-                </div>
-                <div style="text-align: right; opacity: 0.85;">
-                    {trend_html}<br>
-                    <span style="font-size: 0.85em;">Vincent John Rodriguez</span>
-                </div>
-            </div>
-        </div>
+        event_rows = "".join(
+            _EVENT_ROW.format(e.get("name", ""), e.get("count", 0), e.get("sessions", 0))
+            for e in top_events
+        )
 
-        <!-- Date Filter -->
-        <div class="filter-bar">
-            <label>Date Range:</label>
-            <input type="text" id="dateRange" placeholder="Select date range...">
-            <button onclick="applyDateFilter()">Apply Filter</button>
-            <span class="filter-info" id="filterInfo">Showing data for: Last {
-            days
-        } days</span>
-        </div>
+        # Add top queries
+        query_rows = "".join(
+            _QUERY_ROW.format(
+                q.get("keys", [""])[0],
+                q.get("clicks", 0),
+                q.get("position", 0),
+                q.get("ctr", 0),
+            )
+            for q in (gsc.get("top_queries") or [])[:10]
+        )
 
-        <!-- Executive Summary -->
-        {
-            comparison_html
-            if comparison_html
-            else f'''
-        <div class="exec-summary">
-            <h2>Executive Summary</h2>
-            <div class="summary-grid">
-                <div class="summary-item">
-                    <div class="summary-value" id="execScore">{scores.get("overall", 0):.1f}</div>
-                    <div class="summary-label">Overall Score</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value" id="execClicks">{gsc.get("total_clicks", 0):,}</div>
-                    <div class="summary-label">Search Clicks</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value" id="execSessions">{ga4.get("total_sessions", 0):,}</div>
-                    <div class="summary-label">Web Sessions</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value" id="execImpressions">{meta.get("total_impressions", 0):,}</div>
-                    <div class="summary-label">Social Impressions</div>
-                </div>
-            </div>
-        </div>'''
-        }
+        device_rows = ""
+        if ga4.get("device_breakdown"):
+            total_sessions = ga4.get("total_sessions", 1)
+            device_rows = "".join(
+                _DEVICE_ROW.format(
+                    device,
+                    sessions,
+                    (sessions / total_sessions * 100) if total_sessions > 0 else 0,
+                )
+                for device, sessions in ga4.get("device_breakdown", {}).items()
+            )
 
-        <!-- Performance Scores -->
-        <div class="section">
-            <h2 class="section-title">Performance Scores</h2>
-            <div class="grid">
-                <div class="card">
-                    <div class="score-display">
-                        <div class="score" id="scoreOverall">{
-            scores.get("overall", 0):.1f}</div>
-                        <div class="score-label">Overall Score /100</div>
-                    </div>
-                </div>
-                <div class="card">
-                    <h2>Search Visibility</h2>
-                    <div class="metric">
-                        <span class="metric-label">Score</span>
-                        <span class="metric-value" id="scoreGsc">{
-            scores.get("search_visibility", 0):.1f}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Clicks</span>
-                        <span class="metric-value" id="gscClicks">{
-            gsc.get("total_clicks", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Impressions</span>
-                        <span class="metric-value" id="gscImpressions">{
-            gsc.get("total_impressions", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Avg CTR</span>
-                        <span class="metric-value" id="gscCtr">{
-            gsc.get("average_ctr", 0):.2%}</span>
-                    </div>
-                </div>
-                <div class="card">
-                    <h2>Web Analytics</h2>
-                    <div class="metric">
-                        <span class="metric-label">Score</span>
-                        <span class="metric-value" id="scoreGa4">{
-            scores.get("ga4_performance", 0):.1f}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Sessions</span>
-                        <span class="metric-value" id="ga4Sessions">{
-            ga4.get("total_sessions", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Users</span>
-                        <span class="metric-value" id="ga4Users">{
-            ga4.get("total_users", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Bounce Rate</span>
-                        <span class="metric-value" id="ga4Bounce">{
-            ga4.get("bounce_rate", 0):.1%}</span>
-                    </div>
-                </div>
+        recommendations_html = "".join(
+            f"""
+            <div class="recommendation {_REC_PRIORITY_CLASS.get(rec.get("priority"), "")}">
+                <div class="rec-priority">{rec.get("priority", "Medium").upper()} PRIORITY</div>
+                <div class="rec-title">{_strip_rec_emoji(rec.get("title", ""))}</div>
+                <div class="rec-desc">{_strip_rec_emoji(rec.get("description", ""))}</div>
+                <div class="rec-action"><strong>Recommended Action:</strong> {_strip_rec_emoji(rec.get("action", rec.get("description", "")))}</div>
             </div>
-        </div>
+"""
+            for rec in final_recommendations[:10]
+        )
 
-        <!-- GA4 Events Section -->
-        <div class="section" id="eventsSection">
-            <h2 class="section-title">Event Tracking & Conversions</h2>
-            <div class="grid-2">
-                <div class="card">
-                    <h2>Event Summary</h2>
-                    <div class="metric">
-                        <span class="metric-label">Total Events</span>
-                        <span class="metric-value" id="totalEvents">{
-            ga4.get("events", {}).get("total_events", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Event Types</span>
-                        <span class="metric-value" id="totalEventTypes">{
-            ga4.get("events", {}).get("total_event_types", 0)
-        }</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Sessions with Events</span>
-                        <span class="metric-value" id="sessionsWithEvents">{
-            ga4.get("events", {}).get("sessions_with_events", 0):,}</span>
-                    </div>
-                </div>
-                <div class="card">
-                    <h2>Top Events</h2>
-                    <table style="width:100%; border-collapse: collapse; font-size: 0.85em;" id="eventsTable">
-                        <tr style="border-bottom: 2px solid #000;"><th style="text-align:left; padding:8px;">Event</th><th style="text-align:right; padding:8px;">Count</th><th style="text-align:right; padding:8px;">Sessions</th></tr>
-                        {
-            "".join(
-                f'<tr style="border-bottom: 1px solid #eee;"><td style="padding:8px;">{e.get("name", "")}</td><td style="text-align:right; padding:8px;">{e.get("count", 0):,}</td><td style="text-align:right; padding:8px;">{e.get("sessions", 0):,}</td></tr>'
-                for e in ga4.get("events", {}).get("top_events", [])[:8]
+        ai_insights = ai_future.result() if ai_future else None
+        if ai_insights:
+            print("✅ AI insights integrated into dashboard")
+            insights_html = self._generate_ai_html_insights(
+                ai_insights, gsc, ga4, meta, scores
             )
+        else:
+            insights_html = self._generate_dynamic_insights(gsc, ga4, meta, scores)
+
+        values = {
+            "site_name": site_name,
+            "trend_html": trend_html,
+            "days": days,
+            "original_days": days or 30,
+            "exec_summary_html": exec_summary_html,
+            "score_overall": scores.get("overall", 0),
+            "score_gsc": scores.get("search_visibility", 0),
+            "score_ga4": scores.get("ga4_performance", 0),
+            "score_meta": scores.get("meta_performance", 0),
+            "gsc_clicks": f"{gsc.get('total_clicks', 0):,}",
+            "gsc_impressions": f"{gsc.get('total_impressions', 0):,}",
+            "gsc_ctr": f"{gsc.get('average_ctr', 0):.2%}",
+            "ga4_sessions": f"{ga4.get('total_sessions', 0):,}",
+            "ga4_users": f"{ga4.get('total_users', 0):,}",
+            "ga4_bounce": f"{ga4.get('bounce_rate', 0):.1%}",
+            "meta_impressions": f"{meta.get('total_impressions', 0):,}",
+            "meta_followers": f"{meta.get('total_fans', 0):,}",
+            "meta_engagement": f"{meta.get('engagement_rate', 0):.2%}",
+            "total_events": f"{total_events:,}",
+            "total_event_types": total_event_types,
+            "sessions_with_events": f"{sessions_with_events:,}",
+            "event_rows": event_rows,
+            "query_rows": query_rows,
+            "device_rows": device_rows,
+            "insights_html": insights_html,
+            "recommendations_html": recommendations_html,
+            "action_plan_html": self._generate_dynamic_action_plan(
+                gsc, ga4, meta, scores
+            ),
+            "now_str": now_str,
+            "default_start": default_start,
+            "default_end": default_end,
         }
-                    </table>
-                </div>
-            </div>
-        </div>
 
-        <!-- Social Performance -->
-        <div class="section">
-            <h2 class="section-title">Social Performance</h2>
-            <div class="grid-2">
-                <div class="card">
-                    <h2>Social Score</h2>
-                    <div class="metric">
-                        <span class="metric-label">Score</span>
-                        <span class="metric-value" id="scoreMeta">{
-            scores.get("meta_performance", 0):.1f}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Impressions</span>
-                        <span class="metric-value" id="metaImpressions">{
-            meta.get("total_impressions", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Followers</span>
-                        <span class="metric-value" id="metaFollowers">{
-            meta.get("total_fans", 0):,}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Engagement</span>
-                        <span class="metric-value" id="metaEngagement">{
-            meta.get("engagement_rate", 0):.2%}</span>
-                    </div>
-                </div>
-            </div>
-        </div>
+        try:
+            with open(output_path, "wb") as f:
+                _write_exec_dashboard(f.write, values, report_data_b64)
+            print(f"✅ Dynamic executive dashboard saved to: {output_path}")
+            return output_path
+        except Exception as e:
+            print(f"❌ Failed to save dashboard: {e}")
+            return None
 
-        <!-- Charts -->
-        <div class="section">
-            <h2 class="section-title">Performance Charts</h2>
-            <div class="grid-2">
-                <div class="card">
-                    <h2>Channel Performance Comparison</h2>
-                    <div class="chart-container">
-                        <canvas id="channelChart"></canvas>
-                    </div>
-                </div>
-                <div class="card">
-                    <h2>Traffic Distribution</h2>
-                    <div class="chart-container">
-                        <canvas id="trafficChart"></canvas>
-                    </div>
-                </div>
-            </div>
-            <div class="grid-2">
-                <div class="card">
-                    <h2>Key Metrics Overview</h2>
-                    <div class="chart-container">
-                        <canvas id="metricsChart"></canvas>
-                    </div>
-                </div>
-                <div class="card">
-                    <h2>Engagement Rates</h2>
-                    <div class="chart-container">
-                        <canvas id="engagementChart"></canvas>
-                    </div>
-                </div>
-            </div>
-        </div>
+    def _render_cache_path(self, suffix: str, *inputs: Any) -> Path:
+        """Cache file for a render, keyed on its inputs and this module's source"""
+        key = hashlib.blake2b(
+            _dumps((_source_version(), inputs)), digest_size=16
+        ).hexdigest()
+        return self.render_cache_dir / f"{key}.{suffix}"
 
-        <!-- Detailed Tables -->
-        <div class="section">
-            <h2 class="section-title">Detailed Analysis</h2>
-            <div class="grid-2">
-                <div class="card">
-                    <h2>Top Performing Queries</h2>
-                    <table style="width:100%; border-collapse: collapse; font-size: 0.9em;">
-                        <tr style="border-bottom: 2px solid #000;"><th style="text-align:left; padding:10px;">Query</th><th style="text-align:right; padding:10px;">Clicks</th><th style="text-align:right; padding:10px;">Position</th><th style="text-align:right; padding:10px;">CTR</th></tr>
-"""
+    def _load_render(self, cache_path: Path, output_path: str) -> bool:
+        """Copy a cached render to output_path; False on a cache miss"""
+        if not cache_path.is_file():
+            return False
+        try:
+            shutil.copyfile(cache_path, output_path)
+            os.utime(cache_path)  # eviction drops the least recently used
+            return True
+        except OSError:
+            return False
 
-        # Add top queries
-        if gsc.get("top_queries"):
-            for q in gsc.get("top_queries", [])[:10]:
-                query = q.get("keys", [""])[0]
-                clicks = q.get("clicks", 0)
-                position = q.get("position", 0)
-                ctr = q.get("ctr", 0)
-                html += f'<tr style="border-bottom: 1px solid #eee;"><td style="padding:10px;">{query}</td><td style="text-align:right; padding:10px;">{clicks}</td><td style="text-align:right; padding:10px;">{position:.1f}</td><td style="text-align:right; padding:10px;">{ctr:.1%}</td></tr>'
-
-        html += f"""
-                    </table>
-                </div>
-                <div class="card">
-                    <h2>Device Breakdown</h2>
-                    <table style="width:100%; border-collapse: collapse; font-size: 0.9em;">
-                        <tr style="border-bottom: 2px solid #000;"><th style="text-align:left; padding:10px;">Device</th><th style="text-align:right; padding:10px;">Sessions</th><th style="text-align:right; padding:10px;">%</th></tr>
-"""
+    def _store_render(self, output_path: str, cache_path: Path) -> None:
+        """Keep a copy of a fresh render; the cache is best effort"""
+        try:
+            self.render_cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cache_path)
 
-        if ga4.get("device_breakdown"):
-            total_sessions = ga4.get("total_sessions", 1)
-            for device, sessions in ga4.get("device_breakdown", {}).items():
-                pct = (sessions / total_sessions * 100) if total_sessions > 0 else 0
-                html += f'<tr style="border-bottom: 1px solid #eee;"><td style="padding:10px;">{device}</td><td style="text-align:right; padding:10px;">{sessions:,}</td><td style="text-align:right; padding:10px;">{pct:.1f}%</td></tr>'
+            # Keep only the most recently used renders
+            renders = sorted(
+                self.render_cache_dir.iterdir(),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+            for stale in renders[_RENDER_CACHE_SIZE:]:
+                stale.unlink()
+        except OSError as e:
+            print(f"⚠️  Could not cache dashboard render: {e}")
 
-        html += f"""
-                    </table>
-                </div>
-            </div>
-        </div>
+    def _generate_chart_data(self, gsc: Dict, ga4: Dict, meta: Dict) -> Dict:
+        """Generate chart data for the dashboard"""
+        return {"gsc": gsc, "ga4": ga4, "meta": meta}
 
-        <!-- Key Insights -->
-        <div class="section">
-            <h2 class="section-title">Key Insights & Analysis</h2>
-            {self._generate_ai_html_insights(ai_insights, gsc, ga4, meta, scores) if ai_insights else self._generate_dynamic_insights(gsc, ga4, meta, scores)}
-        </div>
+    def export_streamlit_dashboard(
+        self,
+        report: Dict,
+        output_path: str,
+        trends: Optional[Dict] = None,
+        growth_recommendations: Optional[List[Dict]] = None,
+    ) -> str:
+        """Generate a comprehensive Streamlit dashboard with metrics, charts, trends and recommendations"""
+        # generated_at changes every run and the app reads the clock itself
+        cache_path = self._render_cache_path(
+            "py",
+            _without(report, "generated_at"),
+            trends,
+            growth_recommendations,
+            output_path,
+        )
+        if self._load_render(cache_path, output_path):
+            print(f"✅ Streamlit dashboard saved to: {output_path} (cached)")
+            print(f"   Run with: streamlit run {output_path}")
+            return output_path
 
-        <!-- Strategic Recommendations -->
-        <div class="section">
-            <h2 class="section-title">Strategic Recommendations</h2>
-"""
+        site_name = (
+            report.get("site_url", "website")
+            .replace("https://", "")
+            .replace("http://", "")
+            .replace("www.", "")
+        )
+        scores = report.get("scores", {})
+        channels = report.get("channels", {})
+        gsc = channels.get("gsc", {})
+        ga4 = channels.get("ga4", {})
+        meta = channels.get("meta", {})
+        recommendations = report.get("recommendations", [])
 
-        for rec in final_recommendations[:10]:
-            priority_class = (
-                "high"
-                if rec.get("priority") in ["Critical", "High"]
-                else "growth"
-                if rec.get("priority") == "Growth"
-                else ""
-            )
-            rec_title = (
-                rec.get("title", "")
-                .replace("📈", "")
-                .replace("📉", "")
-                .replace("🔴", "")
-                .replace("🎯", "")
-                .replace("📝", "")
-                .replace("🔗", "")
-                .strip()
-            )
-            rec_desc = (
-                rec.get("description", "")
-                .replace("📈", "")
-                .replace("📉", "")
-                .replace("🔴", "")
-                .replace("🎯", "")
-                .replace("📝", "")
-                .replace("🔗", "")
-                .strip()
-            )
-            rec_action = (
-                rec.get("action", rec.get("description", ""))
-                .replace("📈", "")
-                .replace("📉", "")
-                .replace("🔴", "")
-                .replace("🎯", "")
-                .replace("📝", "")
-                .replace("🔗", "")
-                .strip()
-            )
-            html += f"""
-            <div class="recommendation {priority_class}">
-                <div class="rec-priority">{rec.get("priority", "Medium").upper()} PRIORITY</div>
-                <div class="rec-title">{rec_title}</div>
-                <div class="rec-desc">{rec_desc}</div>
-                <div class="rec-action"><strong>Recommended Action:</strong> {rec_action}</div>
-            </div>
-"""
+        # Use growth recommendations if provided, otherwise generate basic ones
+        if growth_recommendations:
+            final_recommendations = growth_recommendations
+        else:
+            final_recommendations = recommendations
 
-        html += f'''
-        </div>
+        # Generate recommendations based on data
+        gsc_recs = self._get_gsc_recommendations(gsc)
+        ga4_recs = self._get_ga4_recommendations(ga4)
+        meta_recs = self._get_meta_recommendations(meta)
 
-        <!-- Action Plan -->
-        <div class="section">
-            <h2 class="section-title">Action Plan</h2>
-            {self._generate_dynamic_action_plan(gsc, ga4, meta, scores)}
-        </div>
+        # Channel data the generated app renders, embedded as one JSON literal.
+        # Sections the app never reads (events, posts, audience, ads) are left out.
+        report_json = _dumps(
+            {
+                "gsc": _gsc_streamlit_view(gsc),
+                "ga4": _without(ga4, "events"),
+                "meta": _without(meta, "recent_posts", "audience", "ads_insights"),
+                "gsc_recs": gsc_recs,
+                "ga4_recs": ga4_recs,
+                "meta_recs": meta_recs,
+            }
+        ).decode("utf-8")
 
-        <!-- Footer -->
-        <div class="footer">
-            <p><strong>Report Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | <strong>Author:</strong> Vincent John Rodriguez | <strong>Confidential</strong></p>
-            <p>This report contains confidential business information. Distribution is limited to authorized personnel only.</p>
-        </div>
-    </div>
+        # Check for trend direction
+        trend_indicator = ""
+        if trends and trends.get("overall"):
+            t = trends["overall"]
+            direction = t.get("direction", "stable")
+            change = t.get("score_change", 0)
+            if direction == "up":
+                trend_indicator = f"📈 +{change:.1f} pts"
+            elif direction == "down":
+                trend_indicator = f"📉 {change:.1f} pts"
+            else:
+                trend_indicator = "➡️ Stable"
 
-    <!-- Embedded Data -->
-    <script>
-        // Report Data
-        const reportData = {{
-            gsc: {gsc_json},
-            ga4: {ga4_json},
-            meta: {meta_json},
-            scores: {scores_json},
-            recommendations: {recommendations_json}
-        }};
+        # Collect the generated source as fragments and join once
+        parts = (
+            '''"""
+Streamlit Dashboard - ''',
+            site_name,
+            """
+Auto-generated by Data Analyst Agent
 
-        // Initialize Date Picker - Click to open calendar
-        let datePicker;
-        document.addEventListener('DOMContentLoaded', function() {{
-            datePicker = flatpickr("#dateRange", {{
-                mode: "range",
-                dateFormat: "Y-m-d",
-                defaultDate: ["{start_date or (datetime.now() - timedelta(days=days or 30)).strftime("%Y-%m-%d")}", "{end_date or datetime.now().strftime("%Y-%m-%d")}"],
-                maxDate: "today",
-                inline: false,
-                showMonths: 1,
-                appendTo: document.querySelector('.filter-bar'),
-                position: "below",
-                onClose: function(selectedDates, dateStr, instance) {{
-                    if (selectedDates.length === 2) {{
-                        applyDateFilter();
-                    }}
-                }}
-            }});
-        }});
+Run with: streamlit run """,
+            output_path,
+            '''
+"""
 
-        // Chart Color Palette (Professional)
-        const colors = {{
-            primary: '#1a1a1a',
-            secondary: '#4a4a4a',
-            tertiary: '#7a7a7a',
-            success: '#198754',
-            danger: '#dc3545',
-            warning: '#ffc107',
-            info: '#0dcaf0',
-            chartColors: ['#1a1a1a', '#4a4a4a', '#7a7a7a', '#198754', '#dc3545', '#0d6efd', '#ffc107']
-        }};
+import json
+import streamlit as st
+import pandas as pd
+import matplotlib.pyplot as plt
+import plotly.express as px
+from datetime import datetime
 
-        // Initialize Charts with proper colors
-        function initCharts() {{
-            const chartColors = ['#1a1a1a', '#4a4a4a', '#7a7a7a'];
-            
-            // Channel Performance Chart
-            const channelCtx = document.getElementById('channelChart');
-            if (channelCtx) {{
-                new Chart(channelCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['Search', 'Web', 'Social'],
-                        datasets: [{{
-                            label: 'Score',
-                            data: [
-                                reportData.scores?.search_visibility || 0, 
-                                reportData.scores?.ga4_performance || 0, 
-                                reportData.scores?.meta_performance || 0
-                            ],
-                            backgroundColor: ['#198754', '#0d6efd', '#ffc107'],
-                            borderColor: ['#198754', '#0d6efd', '#ffc107'],
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{ legend: {{ display: false }} }},
-                        scales: {{ y: {{ beginAtZero: true, max: 100 }} }}
-                    }}
-                }});
-            }}
-
-            // Traffic Distribution Chart (Doughnut)
-            const trafficCtx = document.getElementById('trafficChart');
-            if (trafficCtx) {{
-                new Chart(trafficCtx, {{
-                    type: 'doughnut',
-                    data: {{
-                        labels: ['Search Clicks', 'Web Sessions', 'Social Impressions'],
-                        datasets: [{{
-                            data: [
-                                reportData.gsc?.total_clicks || 1, 
-                                reportData.ga4?.total_sessions || 1, 
-                                Math.floor((reportData.meta?.total_impressions || 1)/1000)
-                            ],
-                            backgroundColor: ['#198754', '#0d6efd', '#ffc107'],
-                            borderColor: '#ffffff',
-                            borderWidth: 3
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{ legend: {{ position: 'bottom', labels: {{ padding: 20 }} }} }}
-                    }}
-                }});
-            }}
-
-            // Metrics Overview Chart (Horizontal Bar)
-            const metricsCtx = document.getElementById('metricsChart');
-            if (metricsCtx) {{
-                new Chart(metricsCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['Clicks', 'Sessions', 'Impressions (K)'],
-                        datasets: [{{
-                            label: 'Volume',
-                            data: [
-                                reportData.gsc?.total_clicks || 0, 
-                                reportData.ga4?.total_sessions || 0, 
-                                Math.floor((reportData.meta?.total_impressions || 0)/1000)
-                            ],
-                            backgroundColor: ['#198754', '#0d6efd', '#ffc107']
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        indexAxis: 'y',
-                        plugins: {{ legend: {{ display: false }} }}
-                    }}
-                }});
-            }}
+# Page config
+st.set_page_config(
+    page_title="''',
+            site_name,
+            ''' Analytics Dashboard",
+    page_icon="📊",
+    layout="wide"
+)
 
-            // Engagement Chart
-            const engagementCtx = document.getElementById('engagementChart');
-            if (engagementCtx) {{
-                new Chart(engagementCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['CTR', 'Engagement', 'Conversion'],
-                        datasets: [{{
-                            label: 'Rate (%)',
-                            data: [
-                                (reportData.gsc?.average_ctr || 0) * 100, 
-                                (reportData.meta?.engagement_rate || 0) * 100, 
-                                (reportData.ga4?.conversion_rate || 0) * 100
-                            ],
-                            backgroundColor: ['#198754', '#1a1a1a', '#dc3545']
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{ legend: {{ display: false }} }},
-                        scales: {{ y: {{ beginAtZero: true }} }}
-                    }}
-                }});
-            }}
 
-            // Traffic Distribution Chart - doughnut with colors
-            new Chart(document.getElementById('trafficChart'), {{
-                type: 'doughnut',
-                data: {{
-                    labels: ['Search Clicks', 'Web Sessions', 'Social Impressions'],
-                    datasets: [{{
-                        data: [reportData.gsc.total_clicks || 1, reportData.ga4.total_sessions || 1, Math.floor((reportData.meta.total_impressions || 1)/1000)],
-                        backgroundColor: ['#1a1a1a', '#4a4a4a', '#7a7a7a'],
-                        borderWidth: 2,
-                        borderColor: '#ffffff'
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {{ legend: {{ position: 'bottom' }} }}
-                }}
-            }});
+# Report data (embedded at generation time), parsed once per server process
+@st.cache_data(show_spinner=False)
+def _load_report():
+    return json.loads(''',
+            repr(report_json),
+            ''')
 
-            // Metrics Overview Chart - horizontal bar
-            new Chart(document.getElementById('metricsChart'), {{
-                type: 'bar',
-                data: {{
-                    labels: ['Clicks', 'Sessions', 'Impressions (K)'],
-                    datasets: [{{
-                        label: 'Volume',
-                        data: [reportData.gsc.total_clicks || 0, reportData.ga4.total_sessions || 0, Math.floor((reportData.meta.total_impressions || 0)/1000)],
-                        backgroundColor: ['#198754', '#0d6efd', '#ffc107'],
-                        borderWidth: 0
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    indexAxis: 'y',
-                    plugins: {{ legend: {{ display: false }} }}
-                }}
-            }});
 
-            // Engagement Chart
-            new Chart(document.getElementById('engagementChart'), {{
-                type: 'bar',
-                data: {{
-                    labels: ['CTR', 'Engagement', 'Conversion'],
-                    datasets: [{{
-                        label: 'Rate (%)',
-                        data: [
-                            (reportData.gsc.average_ctr || 0) * 100, 
-                            (reportData.meta.engagement_rate || 0) * 100, 
-                            (reportData.ga4.conversion_rate || 0) * 100
-                        ],
-                        backgroundColor: ['#198754', '#1a1a1a', '#dc3545'],
-                        borderWidth: 0
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {{ legend: {{ display: false }} }},
-                    scales: {{ y: {{ beginAtZero: true }} }}
-                }}
-            }});
-        }}
+@st.cache_data(show_spinner=False)
+def _top_sources(source_data):
+    return dict(sorted(source_data.items(), key=lambda x: x[1], reverse=True)[:5])
 
-        // Store original data for filtering
-        const originalData = JSON.parse(JSON.stringify(reportData));
-        let currentCharts = {{}};
 
-        // Update metric display
-        function updateMetric(id, value, isPct = false) {{
-            const el = document.getElementById(id);
-            if (el) {{
-                el.textContent = isPct ? value.toFixed(2) + '%' : (typeof value === 'number' ? value.toLocaleString() : value);
-            }}
-        }}
+_REPORT = _load_report()
+gsc = _REPORT["gsc"]
+ga4 = _REPORT["ga4"]
+meta = _REPORT["meta"]
+gsc_recs = _REPORT["gsc_recs"]
+ga4_recs = _REPORT["ga4_recs"]
+meta_recs = _REPORT["meta_recs"]
 
-        // Update all metrics from data
-        function updateMetricsFromData(data) {{
-            if (!data) return;
-            
-            // Executive Summary
-            updateMetric('execScore', data.scores?.overall || 0);
-            updateMetric('execClicks', data.gsc?.total_clicks || 0);
-            updateMetric('execSessions', data.ga4?.total_sessions || 0);
-            updateMetric('execImpressions', data.meta?.total_impressions || 0);
-            
-            // GSC Metrics
-            updateMetric('scoreGsc', data.scores?.search_visibility || 0);
-            updateMetric('gscClicks', data.gsc?.total_clicks || 0);
-            updateMetric('gscImpressions', data.gsc?.total_impressions || 0);
-            updateMetric('gscCtr', (data.gsc?.average_ctr || 0) * 100, true);
-            
-            // GA4 Metrics
-            updateMetric('scoreGa4', data.scores?.ga4_performance || 0);
-            updateMetric('ga4Sessions', data.ga4?.total_sessions || 0);
-            updateMetric('ga4Users', data.ga4?.total_users || 0);
-            updateMetric('ga4Bounce', (data.ga4?.bounce_rate || 0) * 100, true);
-            
-            // Events
-            if (data.ga4?.events) {{
-                updateMetric('totalEvents', data.ga4.events.total_events || 0);
-                updateMetric('totalEventTypes', data.ga4.events.total_event_types || 0);
-                updateMetric('sessionsWithEvents', data.ga4.events.sessions_with_events || 0);
-            }}
-            
-            // Meta Metrics
-            updateMetric('scoreMeta', data.scores?.meta_performance || 0);
-            updateMetric('metaImpressions', data.meta?.total_impressions || 0);
-            updateMetric('metaFollowers', data.meta?.total_fans || 0);
-            updateMetric('metaEngagement', (data.meta?.engagement_rate || 0) * 100, true);
-        }}
-
-        // Re-render charts with new data
-        function updateCharts(data) {{
-            if (!data) return;
-            
-            // Destroy existing charts
-            Object.values(currentCharts).forEach(chart => chart?.destroy());
-            
-            // Channel Performance Chart - with distinct colors
-            currentCharts.channelChart = new Chart(document.getElementById('channelChart'), {{
-                type: 'bar',
-                data: {{
-                    labels: ['Search', 'Web', 'Social'],
-                    datasets: [{{
-                        label: 'Score',
-                        data: [data.scores?.search_visibility || 0, data.scores?.ga4_performance || 0, data.scores?.meta_performance || 0],
-                        backgroundColor: ['#1a1a1a', '#4a4a4a', '#7a7a7a'],
-                        borderColor: ['#1a1a1a', '#4a4a4a', '#7a7a7a'],
-                        borderWidth: 1
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {{ legend: {{ display: false }} }},
-                    scales: {{ y: {{ beginAtZero: true, max: 100 }} }}
-                }}
-            }});
-
-            // Traffic Distribution Chart - doughnut with colors
-            currentCharts.trafficChart = new Chart(document.getElementById('trafficChart'), {{
-                type: 'doughnut',
-                data: {{
-                    labels: ['Search Clicks', 'Web Sessions', 'Social Impressions'],
-                    datasets: [{{
-                        data: [data.gsc?.total_clicks || 1, data.ga4?.total_sessions || 1, Math.floor((data.meta?.total_impressions || 1)/1000)],
-                        backgroundColor: ['#1a1a1a', '#4a4a4a', '#7a7a7a'],
-                        borderWidth: 2,
-                        borderColor: '#ffffff'
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {{ legend: {{ position: 'bottom' }} }}
-                }}
-            }});
-
-            // Metrics Overview Chart - horizontal bar
-            currentCharts.metricsChart = new Chart(document.getElementById('metricsChart'), {{
-                type: 'bar',
-                data: {{
-                    labels: ['Clicks', 'Sessions', 'Impressions (K)'],
-                    datasets: [{{
-                        label: 'Volume',
-                        data: [data.gsc?.total_clicks || 0, data.ga4?.total_sessions || 0, Math.floor((data.meta?.total_impressions || 0)/1000)],
-                        backgroundColor: ['#198754', '#0d6efd', '#ffc107'],
-                        borderWidth: 0
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    indexAxis: 'y',
-                    plugins: {{ legend: {{ display: false }} }}
-                }}
-            }});
-
-            // Engagement Chart
-            currentCharts.engagementChart = new Chart(document.getElementById('engagementChart'), {{
-                type: 'bar',
-                data: {{
-                    labels: ['CTR', 'Engagement', 'Conversion'],
-                    datasets: [{{
-                        label: 'Rate (%)',
-                        data: [
-                            (data.gsc?.average_ctr || 0) * 100, 
-                            (data.meta?.engagement_rate || 0) * 100, 
-                            (data.ga4?.conversion_rate || 0) * 100
-                        ],
-                        backgroundColor: [colors.success, colors.primary, colors.danger]
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {{ legend: {{ display: false }} }},
-                    scales: {{ y: {{ beginAtZero: true }} }}
-                }}
-            }});
-        }}
-
-        // Apply Filter Function
-        function applyDateFilter() {{
-            const dateRange = document.getElementById('dateRange').value;
-            if (dateRange) {{
-                const dates = dateRange.split(' to ');
-                if (dates.length === 2) {{
-                    const startDate = new Date(dates[0]);
-                    const endDate = new Date(dates[1]);
-                    const defaultStart = new Date("{start_date or (datetime.now() - timedelta(days=days or 30)).strftime("%Y-%m-%d")}");
-                    const defaultEnd = new Date("{end_date or datetime.now().strftime("%Y-%m-%d")}");
-                    
-                    // Calculate the day difference
-                    const selectedDays = Math.round((endDate - startDate) / (1000 * 60 * 60 * 24));
-                    const originalDays = {days or 30};
-                    
-                    // Calculate proportional ratio (capped at reasonable bounds)
-                    let ratio = selectedDays / originalDays;
-                    if (ratio < 0.1) ratio = 0.1;
-                    if (ratio > 3) ratio = 3;
-                    
-                    // Update the filter info
-                    document.getElementById('filterInfo').textContent = 'Showing data for: ' + dates[0] + ' to ' + dates[1] + ' (' + selectedDays + ' days - estimated)';
-                    
-                    // Create scaled data based on selected date range
-                    const scaledData = {{
-                        gsc: {{
-                            total_clicks: Math.round(originalData.gsc.total_clicks * ratio),
-                            total_impressions: Math.round(originalData.gsc.total_impressions * ratio),
-                            average_ctr: originalData.gsc.average_ctr,
-                            average_position: originalData.gsc.average_position,
-                            top_queries: originalData.gsc.top_queries || []
-                        }},
-                        ga4: {{
-                            total_sessions: Math.round(originalData.ga4.total_sessions * ratio),
-                            total_users: Math.round(originalData.ga4.total_users * ratio),
-                            total_pageviews: Math.round((originalData.ga4.total_pageviews || originalData.ga4.total_sessions * 2) * ratio),
-                            bounce_rate: originalData.ga4.bounce_rate,
-                            conversions: Math.round(originalData.ga4.conversions * ratio),
-                            conversion_rate: originalData.ga4.conversion_rate,
-                            device_breakdown: originalData.ga4.device_breakdown || {{}},
-                            events: originalData.ga4.events || {{}}
-                        }},
-                        meta: {{
-                            total_impressions: Math.round(originalData.meta.total_impressions * ratio),
-                            total_engaged_users: Math.round(originalData.meta.total_engaged_users * ratio),
-                            total_fans: originalData.meta.total_fans,
-                            engagement_rate: originalData.meta.engagement_rate
-                        }},
-                        scores: originalData.scores
-                    }};
-                    
-                    // Update metrics on the page
-                    updateMetricsFromData(scaledData);
-                    
-                    // Re-render charts with scaled data
-                    updateCharts(scaledData);
-                    
-                    // Show info banner
-                    const infoBanner = document.createElement('div');
-                    infoBanner.id = 'dateFilterBanner';
-                    infoBanner.style.cssText = 'background: #fff3cd; border: 1px solid #ffc107; padding: 12px 20px; margin-bottom: 20px; border-radius: 6px; color: #856404;';
-                    infoBanner.innerHTML = '<strong>Note:</strong> Showing estimated data based on proportional calculation (' + selectedDays + ' days vs original ' + originalDays + ' days). For accurate data, run the agent with: <code style="background: #f0f0f0; padding: 4px 8px; border-radius: 4px; font-size: 0.9em;">python data_analyst.py {site_name} --days ' + selectedDays + '</code>';
-                    
-                    // Remove old banner if exists
-                    const existing = document.getElementById('dateFilterBanner');
-                    if (existing) existing.remove();
-                    
-                    // Add new banner after the filter bar
-                    document.querySelector('.filter-bar').after(infoBanner);
-                    
-                    // Scroll to top
-                    window.scrollTo({{ top: 0, behavior: 'smooth' }});
-                }}
-            }}
-        }}
-
-        // Initialize on load
-        window.onload = function() {{
-            initCharts();
-            updateCharts(reportData);
-        }};
-    </script>
-</body>
-</html>'''
-
-        try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"✅ Dynamic executive dashboard saved to: {output_path}")
-            return output_path
-        except Exception as e:
-            print(f"❌ Failed to save dashboard: {e}")
-            return None
-
-    def _generate_chart_data(self, gsc: Dict, ga4: Dict, meta: Dict) -> Dict:
-        """Generate chart data for the dashboard"""
-        return {"gsc": gsc, "ga4": ga4, "meta": meta}
-
-    def export_streamlit_dashboard(
-        self,
-        report: Dict,
-        output_path: str,
-        trends: Optional[Dict] = None,
-        growth_recommendations: Optional[List[Dict]] = None,
-    ) -> str:
-        """Generate a comprehensive Streamlit dashboard with metrics, charts, trends and recommendations"""
-        site_name = (
-            report.get("site_url", "website")
-            .replace("https://", "")
-            .replace("http://", "")
-            .replace("www.", "")
-        )
-        scores = report.get("scores", {})
-        channels = report.get("channels", {})
-        gsc = channels.get("gsc", {})
-        ga4 = channels.get("ga4", {})
-        meta = channels.get("meta", {})
-        recommendations = report.get("recommendations", [])
-
-        # Use growth recommendations if provided, otherwise generate basic ones
-        if growth_recommendations:
-            final_recommendations = growth_recommendations
-        else:
-            final_recommendations = recommendations
-
-        # Generate recommendations based on data
-        gsc_recs = self._get_gsc_recommendations(gsc)
-        ga4_recs = self._get_ga4_recommendations(ga4)
-        meta_recs = self._get_meta_recommendations(meta)
-
-        # Check for trend direction
-        trend_indicator = ""
-        if trends and trends.get("overall"):
-            t = trends["overall"]
-            direction = t.get("direction", "stable")
-            change = t.get("score_change", 0)
-            if direction == "up":
-                trend_indicator = f"📈 +{change:.1f} pts"
-            elif direction == "down":
-                trend_indicator = f"📉 {change:.1f} pts"
-            else:
-                trend_indicator = "➡️ Stable"
-
-        st_app = (
-            '''"""
-Streamlit Dashboard - '''
-            + site_name
-            + """
-Auto-generated by Data Analyst Agent
-
-Run with: streamlit run """
-            + output_path
-            + '''
-"""
-
-import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-from datetime import datetime
-
-# Page config
-st.set_page_config(
-    page_title="'''
-            + site_name
-            + ''' Analytics Dashboard",
-    page_icon="📊",
-    layout="wide"
-)
+# Recommendation badge colors by priority (anything else renders as Low)
+PRIORITY_COLORS = {"High": "#dc3545", "Medium": "#ffc107", "Low": "#28a745"}
 
 # Custom CSS for better styling
 st.markdown("""
@@ -2594,9 +2307,9 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Title
-st.title("📊 '''
-            + site_name
-            + """ Analytics Dashboard")
+st.title("📊 ''',
+            site_name,
+            """ Analytics Dashboard")
 st.markdown(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')} | **Period:** Last 30 days")
 st.markdown("---")
 
@@ -2608,27 +2321,27 @@ st.header("🎯 Performance Overview")
 
 col1, col2, col3, col4 = st.columns(4)
 
-overall_score = """
-            + f"{scores.get('overall', 0):.1f}"
-            + '''
+overall_score = """,
+            f"{scores.get('overall', 0):.1f}",
+            '''
 with col1:
     st.metric("Overall Score", overall_score + "/100", 
                delta="Excellent" if float(overall_score) >= 80 else "Good" if float(overall_score) >= 60 else "Needs Work")
 
 with col2:
-    st.metric("Search Visibility", "'''
-            + f"{scores.get('search_visibility', 0):.1f}"
-            + '''/100')
+    st.metric("Search Visibility", "''',
+            f"{scores.get('search_visibility', 0):.1f}",
+            '''/100")
 
 with col3:
-    st.metric("GA4 Performance", "'''
-            + f"{scores.get('ga4_performance', 0):.1f}"
-            + '''/100")
+    st.metric("GA4 Performance", "''',
+            f"{scores.get('ga4_performance', 0):.1f}",
+            '''/100")
 
 with col4:
-    st.metric("Meta Performance", "'''
-            + f"{scores.get('meta_performance', 0):.1f}"
-            + '''/100")
+    st.metric("Meta Performance", "''',
+            f"{scores.get('meta_performance', 0):.1f}",
+            '''/100")
 
 # Score explanation
 with st.expander("📖 Understanding the Scores"):
@@ -2647,13 +2360,13 @@ st.header("🔍 Google Search Console (SEO)")
 # GSC Metrics
 col_g1, col_g2, col_g3, col_g4 = st.columns(4)
 with col_g1:
-    st.metric("Total Clicks", "'''
-            + f"{gsc.get('total_clicks', 0):,}"
-            + '''")
+    st.metric("Total Clicks", "''',
+            f"{gsc.get('total_clicks', 0):,}",
+            '''")
 with col_g2:
-    st.metric("Total Impressions", "'''
-            + f"{gsc.get('total_impressions', 0):,}"
-            + '''")
+    st.metric("Total Impressions", "''',
+            f"{gsc.get('total_impressions', 0):,}",
+            '''")
 with col_g3:
     ctr = gsc.get('average_ctr', 0)
     ctr_display = f"{ctr:.2%}"
@@ -2684,21 +2397,19 @@ else:
 # GSC Top Queries
 if gsc.get("top_queries"):
     st.markdown("### 📋 Top Performing Queries")
-    queries_data = []
+    cols = {"Query": [], "Clicks": [], "Impressions": [], "CTR": [], "Position": []}
     for q in gsc.get("top_queries", [])[:10]:
-        queries_data.append({
-            "Query": q.get("keys", [""])[0],
-            "Clicks": q.get("clicks", 0),
-            "Impressions": q.get("impressions", 0),
-            "CTR": f"{q.get('ctr', 0):.1%}",
-            "Position": q.get("position", 0)
-        })
-    st.dataframe(pd.DataFrame(queries_data), use_container_width=True)
+        cols["Query"].append(q.get("keys", [""])[0])
+        cols["Clicks"].append(q.get("clicks", 0))
+        cols["Impressions"].append(q.get("impressions", 0))
+        cols["CTR"].append(f"{q.get('ctr', 0):.1%}")
+        cols["Position"].append(q.get("position", 0))
+    st.dataframe(pd.DataFrame(cols), use_container_width=True)
 
 # GSC Recommendations
 st.markdown("### 🎯 Recommendations for SEO")
 for rec in gsc_recs:
-    priority_color = "#dc3545" if rec['priority'] == 'High' else "#ffc107" if rec['priority'] == 'Medium' else "#28a745"
+    priority_color = PRIORITY_COLORS.get(rec['priority'], "#28a745")
     st.markdown(f"""
     <div class="recommendation-box">
         <b style="color:{priority_color}">[{rec['priority'].upper()}]</b> <b>{rec['title']}</b><br>
@@ -2714,22 +2425,22 @@ st.header("📊 Google Analytics 4 (Web Analytics)")
 # GA4 Metrics
 col_ga1, col_ga2, col_ga3, col_ga4 = st.columns(4)
 with col_ga1:
-    st.metric("Sessions", "'''
-            + f"{ga4.get('total_sessions', 0):,}"
-            + '''")
+    st.metric("Sessions", "''',
+            f"{ga4.get('total_sessions', 0):,}",
+            '''")
 with col_ga2:
-    st.metric("Users", "'''
-            + f"{ga4.get('total_users', 0):,}"
-            + '''")
+    st.metric("Users", "''',
+            f"{ga4.get('total_users', 0):,}",
+            '''")
 with col_ga3:
     br = ga4.get('bounce_rate', 0)
     st.metric("Bounce Rate", f"{br:.1%}", 
                delta="Good" if br < 0.4 else "Needs Improvement",
                delta_color="inverse")
 with col_ga4:
-    st.metric("Conversions", "'''
-            + f"{ga4.get('conversions', 0)}"
-            + '''")
+    st.metric("Conversions", "''',
+            f"{ga4.get('conversions', 0)}",
+            '''")
 
 # GA4 Insights
 st.markdown("### 💡 Insights")
@@ -2762,8 +2473,7 @@ if ga4.get("device_breakdown"):
 # GA4 Source Breakdown
 if ga4.get("source_breakdown"):
     st.markdown("### 🌐 Traffic Sources")
-    source_data = ga4.get("source_breakdown", {})
-    sorted_sources = dict(sorted(source_data.items(), key=lambda x: x[1], reverse=True)[:5])
+    sorted_sources = _top_sources(ga4.get("source_breakdown", {}))
     source_df = pd.DataFrame(list(sorted_sources.items()), columns=['Source', 'Sessions'])
     fig2 = px.bar(source_df, x='Source', y='Sessions', 
                    title='Top 5 Traffic Sources',
@@ -2773,7 +2483,7 @@ if ga4.get("source_breakdown"):
 # GA4 Recommendations
 st.markdown("### 🎯 Recommendations for GA4")
 for rec in ga4_recs:
-    priority_color = "#dc3545" if rec['priority'] == 'High' else "#ffc107" if rec['priority'] == 'Medium' else "#28a745"
+    priority_color = PRIORITY_COLORS.get(rec['priority'], "#28a745")
     st.markdown(f"""
     <div class="recommendation-box">
         <b style="color:{priority_color}">[{rec['priority'].upper()}]</b> <b>{rec['title']}</b><br>
@@ -2789,21 +2499,21 @@ st.header("📱 Meta/Facebook Insights")
 # Meta Metrics
 col_m1, col_m2, col_m3, col_m4 = st.columns(4)
 with col_m1:
-    st.metric("Impressions", "'''
-            + f"{meta.get('total_impressions', 0):,}"
-            + '''")
+    st.metric("Impressions", "''',
+            f"{meta.get('total_impressions', 0):,}",
+            '''")
 with col_m2:
-    st.metric("Page Fans", "'''
-            + f"{meta.get('total_fans', 0):,}"
-            + '''")
+    st.metric("Page Fans", "''',
+            f"{meta.get('total_fans', 0):,}",
+            '''")
 with col_m3:
     er = meta.get('engagement_rate', 0)
     st.metric("Engagement Rate", f"{er:.2%}",
                delta="Good" if er > 0.03 else "Needs Improvement")
 with col_m4:
-    st.metric("Avg Daily Impressions", "'''
-            + f"{meta.get('avg_daily_impressions', 0):,}"
-            + '''")
+    st.metric("Avg Daily Impressions", "''',
+            f"{meta.get('avg_daily_impressions', 0):,}",
+            '''")
 
 # Meta Insights
 st.markdown("### 💡 Insights")
@@ -2825,7 +2535,7 @@ else:
 # Meta Recommendations
 st.markdown("### 🎯 Recommendations for Meta")
 for rec in meta_recs:
-    priority_color = "#dc3545" if rec['priority'] == 'High' else "#ffc107" if rec['priority'] == 'Medium' else "#28a745"
+    priority_color = PRIORITY_COLORS.get(rec['priority'], "#28a745")
     st.markdown(f"""
     <div class="recommendation-box">
         <b style="color:{priority_color}">[{rec['priority'].upper()}]</b> <b>{rec['title']}</b><br>
@@ -2858,12 +2568,13 @@ st.markdown("""
 # Footer
 st.markdown("---")
 st.markdown("*Dashboard generated by Data Analyst Agent | For internal use only*")
-'''
+''',
         )
+        st_app = "".join(parts)
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(st_app)
+            Path(output_path).write_bytes(st_app.encode("utf-8"))
+            self._store_render(output_path, cache_path)
             print(f"✅ Streamlit dashboard saved to: {output_path}")
             print(f"   Run with: streamlit run {output_path}")
             return output_path
@@ -2875,125 +2586,19 @@ st.markdown("*Dashboard generated by Data Analyst Agent | For internal use only*
         self, gsc: Dict, ga4: Dict, meta: Dict, scores: Dict
     ) -> str:
         """Generate dynamic insights based on actual data"""
-        insights = []
-
-        # GSC Insights
-        gsc_clicks = gsc.get("total_clicks", 0)
-        gsc_pos = gsc.get("average_position", 0)
-        gsc_ctr = gsc.get("average_ctr", 0)
-
-        if gsc_clicks < 50:
-            insights.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Critical: Low Search Traffic</strong><br>
-                Only {gsc_clicks} clicks in the reporting period. Your SEO strategy needs immediate attention.
-                Recommendation: Focus on ranking for long-tail keywords and optimize existing content.
-            </div>""")
-        elif gsc_clicks < 200:
-            insights.append(f"""<div class="insight" style="border-left-color: #ffc107;">
-                <strong>Search Traffic Below Average</strong><br>
-                {gsc_clicks} clicks with {gsc_pos:.1f} average position. Room for improvement in rankings.
-                Recommendation: Target keywords ranking positions 4-10 to move them to top 3.
-            </div>""")
-        else:
-            insights.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Good Search Visibility</strong><br>
-                {gsc_clicks} clicks with {gsc_pos:.1f} average position. Keep building on this momentum.
-            </div>""")
-
-        if gsc_ctr < 0.03:
-            insights.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Low CTR ({gsc_ctr:.1%})</strong><br>
-                Click-through rate is below industry average. Optimize title tags and meta descriptions.
-            </div>""")
-
-        # GA4 Insights
-        ga4_sessions = ga4.get("total_sessions", 0)
-        ga4_bounce = ga4.get("bounce_rate", 0)
-        ga4_conversions = ga4.get("conversions", 0)
-
-        if ga4_bounce > 0.7:
-            insights.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Critical: High Bounce Rate ({ga4_bounce:.1%})</strong><br>
-                Majority of visitors leave without engaging. This severely impacts conversions.
-                Action: Audit landing pages, improve page load speed, enhance content quality.
-            </div>""")
-        elif ga4_bounce > 0.5:
-            insights.append(f"""<div class="insight" style="border-left-color: #ffc107;">
-                <strong>Elevated Bounce Rate ({ga4_bounce:.1%})</strong><br>
-                Consider improving user engagement and content relevance.
-            </div>""")
-        else:
-            insights.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Healthy Bounce Rate ({ga4_bounce:.1%})</strong><br>
-                Good user engagement levels. Continue monitoring.
-            </div>""")
-
-        if ga4_conversions == 0:
-            insights.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>No Conversions Tracked</strong><br>
-                Zero conversions from {ga4_sessions} sessions. This is a critical gap.
-                Action: Set up conversion events in GA4 for key actions (form submissions, purchases, signups).
-            </div>""")
-        else:
-            conv_rate = ga4.get("conversion_rate", 0) * 100
-            insights.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>{ga4_conversions} Conversions Recorded</strong><br>
-                {conv_rate:.2f}% conversion rate. Monitor to identify high-performing pages.
-            </div>""")
-
-        # Events data
-        events = ga4.get("events", {})
-        if events:
-            top_events = events.get("top_events", [])
-            if top_events:
-                event_names = [e.get("name", "") for e in top_events[:5]]
-                insights.append(f"""<div class="insight" style="border-left-color: #0dcaf0;">
-                    <strong>Top Tracked Events:</strong><br>
-                    {", ".join(event_names)}. These represent user interactions on your site.
-                </div>""")
-
-        # Meta Insights
-        meta_impressions = meta.get("total_impressions", 0)
-        meta_er = meta.get("engagement_rate", 0)
-        meta_fans = meta.get("total_fans", 0)
-
-        if meta_impressions > 100000:
-            insights.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Strong Social Reach</strong><br>
-                {meta_impressions:,} impressions reaching {meta_fans:,} followers.
-                Leverage this reach for website traffic.
-            </div>""")
-        elif meta_impressions > 10000:
-            insights.append(f"""<div class="insight" style="border-left-color: #ffc107;">
-                <strong>Moderate Social Presence</strong><br>
-                {meta_impressions:,} impressions. Increase posting frequency for better reach.
-            </div>""")
-
-        if meta_er < 0.02:
-            insights.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Low Engagement Rate ({meta_er:.2%})</strong><br>
-                Content may not be resonating. Try video content, polls, and questions.
-            </div>""")
-
-        # Overall Score Insight
-        overall = scores.get("overall", 0)
-        if overall >= 70:
-            insights.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Overall Performance: {overall:.1f}/100</strong><br>
-                Strong multi-channel performance. Maintain current strategies.
-            </div>""")
-        elif overall >= 50:
-            insights.append(f"""<div class="insight" style="border-left-color: #ffc107;">
-                <strong>Overall Performance: {overall:.1f}/100</strong><br>
-                Moderate performance across channels. Focus on improving weak areas.
-            </div>""")
-        else:
-            insights.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Overall Performance: {overall:.1f}/100 - Needs Attention</strong><br>
-                Multiple areas require improvement. Prioritize high-impact changes.
-            </div>""")
+        ctx = _insight_metrics(gsc, ga4, meta, scores)
+
+        buf = io.StringIO()
+        for color, title, body in _insight_cards(ctx):
+            buf.write(
+                _INSIGHT_HTML.format(
+                    color=color,
+                    title=title.format_map(ctx),
+                    body=body.format_map(ctx),
+                )
+            )
 
-        return "\n".join(insights)
+        return buf.getvalue()
 
     def _generate_dynamic_action_plan(
         self, gsc: Dict, ga4: Dict, meta: Dict, scores: Dict
@@ -3044,41 +2649,34 @@ st.markdown("*Dashboard generated by Data Analyst Agent | For internal use only*
         long_term.append("Test paid advertising campaigns")
         long_term.append("Build strategic brand partnerships")
 
-        html = f"""<div class="grid-3">
-            <div class="card">
-                <h2>Immediate (This Week)</h2>
-                <ul style="margin: 15px 0 0 20px;">
-                    {"".join(f'<li style="margin: 12px 0;">{item}</li>' for item in immediate)}
-                </ul>
-            </div>
-            <div class="card">
-                <h2>Short-Term (30 Days)</h2>
-                <ul style="margin: 15px 0 0 20px;">
-                    {"".join(f'<li style="margin: 12px 0;">{item}</li>' for item in short_term)}
-                </ul>
-            </div>
-            <div class="card">
-                <h2>Long-Term (Quarter)</h2>
-                <ul style="margin: 15px 0 0 20px;">
-                    {"".join(f'<li style="margin: 12px 0;">{item}</li>' for item in long_term)}
-                </ul>
-            </div>
-        </div>"""
+        return _ACTION_PLAN_TEMPLATE.format(
+            immediate="".join(map(_LI, immediate)),
+            short_term="".join(map(_LI, short_term)),
+            long_term="".join(map(_LI, long_term)),
+        )
 
-        return html
+    def _has_ai_key(self) -> bool:
+        """True when a real (non-placeholder) OpenRouter API key is configured"""
+        return bool(self.openrouter_api_key) and (
+            self.openrouter_api_key != _OPENROUTER_PLACEHOLDER_KEY
+        )
 
     def generate_ai_insights(
         self, gsc: Dict, ga4: Dict, meta: Dict, scores: Dict
     ) -> Dict[str, str]:
         """Generate comprehensive AI-powered insights using OpenRouter"""
-        if (
-            not self.openrouter_api_key
-            or self.openrouter_api_key
-            == "sk-or-v1-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
-        ):
+        if not self._has_ai_key():
             return None
 
+        cache_key = hashlib.blake2b(
+            _dumps([gsc, ga4, meta, scores]), digest_size=16
+        ).digest()
+        if self.enable_ai_cache and cache_key in self._ai_cache:
+            return self._ai_cache[cache_key]
+
         try:
+            top_events = (ga4.get("events") or {}).get("top_events", [])
+
             # Prepare data summary for AI
             data_summary = f"""
 Website Analytics Summary:
@@ -3086,496 +2684,1576 @@ Website Analytics Summary:
 - Web (GA4): {ga4.get("total_sessions", 0)} sessions, {ga4.get("total_users", 0)} users, {ga4.get("bounce_rate", 0):.1%} bounce rate, {ga4.get("conversions", 0)} conversions
 - Social (Meta): {meta.get("total_impressions", 0):,} impressions, {meta.get("total_fans", 0):,} followers, {meta.get("engagement_rate", 0):.2%} engagement
 - Overall Score: {scores.get("overall", 0):.1f}/100
-- Top Events: {[e.get("name") for e in ga4.get("events", {}).get("top_events", [])[:5]]}
+- Top Events: {[e.get("name") for e in top_events[:5]]}
             """
 
-            prompt = f"""Analyze this website analytics data and provide:
+            prompt = f"""Analyze this website analytics data and provide:
+
+1. KEY INSIGHTS (3-4 bullet points): Identify the most critical findings about performance, user behavior, and growth opportunities. Each insight should be 1-2 sentences.
+
+2. STRATEGIC RECOMMENDATIONS (5-7 items): Provide specific, actionable recommendations with priority levels (Critical/High/Medium). Include the specific metric that needs attention and concrete action to take.
+
+3. ACTION PLAN: Organize actions into:
+   - Immediate (This Week): 3-4 urgent actions
+   - Short-Term (30 Days): 4-5 strategic actions  
+   - Long-Term (Quarter): 3-4 growth initiatives
+
+Use a professional, executive-level tone. Focus on business impact. Include specific numbers from the data.
+
+Data:
+{data_summary}
+
+Format your response as JSON with keys: "insights", "recommendations", "action_plan_immediate", "action_plan_short", "action_plan_long". Each recommendation should have: priority, title, description, action."""
+
+            # Healthy reports need a shorter answer; allow more room per critical issue
+            critical_count = sum(
+                color == _CRITICAL
+                for color, _, _ in _insight_cards(
+                    _insight_metrics(gsc, ga4, meta, scores)
+                )
+            )
+
+            # Pre-encoded body; Content-Type comes from the session headers
+            response = self._http.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                data=_dumps(
+                    {
+                        "model": "anthropic/claude-3-haiku",
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": min(1200 + 200 * critical_count, 2000),
+                        "stream": False,
+                    }
+                ),
+                timeout=30,
+            )
+
+            if response.status_code == 200:
+                result = _loads(response.content)
+                content = (
+                    result.get("choices", [{}])[0].get("message", {}).get("content", "")
+                )
+
+                # Try to parse JSON from response
+                start = content.find("{")
+                if start >= 0:
+                    try:
+                        ai_data, _ = _JSON_DECODER.raw_decode(content, start)
+                        print("✅ AI Insights generated successfully")
+                        if self.enable_ai_cache:
+                            if len(self._ai_cache) >= 32:
+                                del self._ai_cache[next(iter(self._ai_cache))]
+                            self._ai_cache[cache_key] = ai_data
+                        return ai_data
+                    except json.JSONDecodeError:
+                        pass
+
+            print(f"⚠️ AI generation returned: {response.status_code}")
+            return None
+
+        except Exception as e:
+            print(f"⚠️ AI insights generation failed: {e}")
+            return None
+
+    def _generate_comparison_html(
+        self,
+        gsc,
+        prev_gsc,
+        ga4,
+        prev_ga4,
+        meta,
+        prev_meta,
+        scores,
+        prev_scores,
+        prev_start,
+        prev_end,
+    ) -> str:
+        """Generate C-suite style comparison HTML for monthly reports"""
+        gsc_fields = ("total_clicks", "total_impressions", "average_ctr", "average_position")
+        gsc_clicks, gsc_impr, gsc_ctr, gsc_pos = _metrics(gsc, *gsc_fields)
+        prev_gsc_clicks, prev_gsc_impr, prev_gsc_ctr, prev_gsc_pos = _metrics(
+            prev_gsc, *gsc_fields
+        )
+        ga4_fields = ("total_sessions", "total_users", "bounce_rate", "conversions")
+        ga4_sessions, ga4_users, ga4_bounce, ga4_conversions = _metrics(
+            ga4, *ga4_fields
+        )
+        prev_ga4_sessions, prev_ga4_users, prev_ga4_bounce, prev_ga4_conversions = (
+            _metrics(prev_ga4, *ga4_fields)
+        )
+        meta_fields = ("total_impressions", "engagement_rate", "total_fans")
+        meta_impr, meta_er, meta_fans = _metrics(meta, *meta_fields)
+        prev_meta_impr, prev_meta_er, prev_meta_fans = _metrics(prev_meta, *meta_fields)
+        score_fields = (
+            "overall",
+            "search_visibility",
+            "ga4_performance",
+            "meta_performance",
+        )
+        overall, search_score, ga4_score, meta_score = _metrics(scores, *score_fields)
+        prev_overall, prev_search_score, prev_ga4_score, prev_meta_score = _metrics(
+            prev_scores, *score_fields
+        )
+
+        gsc_clicks_diff, gsc_clicks_pct = _change(gsc_clicks, prev_gsc_clicks)
+        ga4_sessions_diff, ga4_sessions_pct = _change(ga4_sessions, prev_ga4_sessions)
+        meta_impr_diff, meta_impr_pct = _change(meta_impr, prev_meta_impr)
+        gsc_impr_diff = gsc_impr - prev_gsc_impr
+        bounce_diff = (ga4_bounce - prev_ga4_bounce) * 100
+        overall_diff = overall - prev_overall
+
+        return _COMPARISON_TEMPLATE.format(
+            prev_start=prev_start,
+            prev_end=prev_end,
+            overall=overall,
+            prev_overall=prev_overall,
+            overall_trend=_trend_class(overall_diff),
+            overall_change=_fmt_pct(overall_diff),
+            gsc_clicks=gsc_clicks,
+            prev_gsc_clicks=prev_gsc_clicks,
+            gsc_clicks_trend=_trend_class(gsc_clicks_diff),
+            gsc_clicks_change=_fmt_pct(gsc_clicks_pct),
+            gsc_impr=gsc_impr,
+            prev_gsc_impr=prev_gsc_impr,
+            gsc_impr_change=_fmt_num(gsc_impr_diff),
+            gsc_ctr=gsc_ctr,
+            prev_gsc_ctr=prev_gsc_ctr,
+            gsc_ctr_change=(gsc_ctr - prev_gsc_ctr) * 100,
+            gsc_pos=gsc_pos,
+            prev_gsc_pos=prev_gsc_pos,
+            gsc_pos_change=gsc_pos - prev_gsc_pos,
+            ga4_sessions=ga4_sessions,
+            prev_ga4_sessions=prev_ga4_sessions,
+            ga4_sessions_trend=_trend_class(ga4_sessions_diff),
+            ga4_sessions_change=_fmt_pct(ga4_sessions_pct),
+            ga4_users=ga4_users,
+            prev_ga4_users=prev_ga4_users,
+            ga4_users_change=ga4_users - prev_ga4_users,
+            ga4_bounce=ga4_bounce,
+            prev_ga4_bounce=prev_ga4_bounce,
+            bounce_diff=bounce_diff,
+            bounce_trend=_trend_class(bounce_diff, True),
+            ga4_conversions=ga4_conversions,
+            prev_ga4_conversions=prev_ga4_conversions,
+            conversions_change=ga4_conversions - prev_ga4_conversions,
+            meta_impr=meta_impr,
+            prev_meta_impr=prev_meta_impr,
+            meta_impr_trend=_trend_class(meta_impr_diff),
+            meta_impr_change=_fmt_pct(meta_impr_pct),
+            meta_er=meta_er,
+            prev_meta_er=prev_meta_er,
+            meta_er_change=(meta_er - prev_meta_er) * 100,
+            meta_fans=meta_fans,
+            prev_meta_fans=prev_meta_fans,
+            meta_fans_change=meta_fans - prev_meta_fans,
+            search_score=search_score,
+            prev_search_score=prev_search_score,
+            search_score_change=search_score - prev_search_score,
+            ga4_score=ga4_score,
+            prev_ga4_score=prev_ga4_score,
+            ga4_score_change=ga4_score - prev_ga4_score,
+            meta_score=meta_score,
+            prev_meta_score=prev_meta_score,
+            meta_score_change=meta_score - prev_meta_score,
+            takeaways_html=self._generate_takeaways(
+                gsc, prev_gsc, ga4, prev_ga4, meta, prev_meta, scores, prev_scores
+            ),
+        )
+
+    def _generate_takeaways(
+        self, gsc, prev_gsc, ga4, prev_ga4, meta, prev_meta, scores, prev_scores
+    ) -> str:
+        """Generate executive takeaways based on comparison"""
+        buf = io.StringIO()
+
+        ga4_fields = ("total_sessions", "bounce_rate", "conversions")
+        sessions, bounce, conv_curr = _metrics(ga4, *ga4_fields)
+        prev_sessions, prev_bounce, conv_prev = _metrics(prev_ga4, *ga4_fields)
+        clicks, prev_clicks = gsc.get("total_clicks", 0), prev_gsc.get("total_clicks", 0)
+        impressions = meta.get("total_impressions", 0)
+        prev_impressions = prev_meta.get("total_impressions", 0)
+        # Percent-change baselines; an empty previous period counts as 1
+        clicks_base = prev_clicks or 1
+        sessions_base = prev_sessions or 1
+        impressions_base = prev_impressions or 1
+
+        gsc_diff = clicks - prev_clicks
+        ga4_diff = sessions - prev_sessions
+        bounce_change = bounce - prev_bounce
+        meta_diff = impressions - prev_impressions
+        overall_diff = scores.get("overall", 0) - prev_scores.get("overall", 0)
+        search, traffic, bounce_move, social, score = map(
+            _movement,
+            (gsc_diff, ga4_diff, bounce_change, meta_diff, overall_diff),
+            (0, 0, 0.05, 0, 2),
+        )
+
+        card = _TAKEAWAY_SEARCH[search]
+        if card:
+            buf.write(
+                card.format(
+                    diff=abs(gsc_diff), pct=abs(gsc_diff) / clicks_base * 100
+                )
+            )
+
+        card = _TAKEAWAY_TRAFFIC[traffic]
+        if card:
+            buf.write(
+                card.format(diff=ga4_diff, pct=(ga4_diff / sessions_base) * 100)
+            )
+
+        card = _TAKEAWAY_BOUNCE[bounce_move]
+        if card:
+            buf.write(card.format(points=abs(bounce_change) * 100))
+
+        if conv_curr > conv_prev:
+            buf.write(
+                _TAKEAWAY_CONVERSIONS_UP.format(
+                    prev=conv_prev, curr=conv_curr, diff=conv_curr - conv_prev
+                )
+            )
+        elif conv_curr == 0 and conv_prev == 0:
+            buf.write(_TAKEAWAY_NO_CONVERSIONS)
+
+        card = _TAKEAWAY_SOCIAL[social]
+        if card:
+            buf.write(card.format(pct=(meta_diff / impressions_base) * 100))
+
+        card = _TAKEAWAY_SCORE[score]
+        if card:
+            buf.write(card.format(points=abs(overall_diff)))
+
+        return buf.getvalue() or _TAKEAWAY_NONE
+
+    def _generate_ai_html_insights(
+        self, ai_insights: Dict, gsc: Dict, ga4: Dict, meta: Dict, scores: Dict
+    ) -> str:
+        """Generate HTML for AI-powered insights"""
+        if not ai_insights:
+            return self._generate_dynamic_insights(gsc, ga4, meta, scores)
+
+        insights_html = ""
+
+        # Add AI-generated insights
+        if "insights" in ai_insights:
+            for i, insight in enumerate(ai_insights.get("insights", [])):
+                insights_html += _AI_INSIGHT_HTML.format(
+                    color=_AI_COLORS[min(i, 3)], insight=insight
+                )
+
+        # Add AI-generated recommendations
+        if "recommendations" in ai_insights:
+            for rec in ai_insights.get("recommendations", []):
+                priority = rec.get("priority", "Medium").lower()
+                insights_html += _AI_REC_HTML.format(
+                    priority_class=_AI_PRIORITY_CLASS.get(priority, ""),
+                    color=_AI_PRIORITY_COLORS.get(priority, "#198754"),
+                    priority=rec.get("priority", "Medium").upper(),
+                    title=rec.get("title", ""),
+                    description=rec.get("description", ""),
+                    action=rec.get("action", rec.get("description", "")),
+                )
+
+        return insights_html
+
+    def _get_gsc_recommendations(self, gsc: Dict) -> List[Dict]:
+        """Generate GSC-specific recommendations"""
+        return _apply_rules(gsc, _GSC_REC_RULES, _GSC_REC_FALLBACK)
+
+    def _get_ga4_recommendations(self, ga4: Dict) -> List[Dict]:
+        """Generate GA4-specific recommendations"""
+        return _apply_rules(ga4, _GA4_REC_RULES, _GA4_REC_FALLBACK)
+
+    def _get_meta_recommendations(self, meta: Dict) -> List[Dict]:
+        """Generate Meta-specific recommendations"""
+        return _apply_rules(meta, _META_REC_RULES)
+
+
+# ==================== HTML TEMPLATES ====================
+
+# Month-over-month comparison block for monthly reports, rendered by
+# DataAnalyst._generate_comparison_html with precomputed values
+_COMPARISON_TEMPLATE = """
+        <div class="exec-summary">
+            <h2>Executive Summary - Month over Month Analysis</h2>
+            <div style="font-size: 0.9em; margin-bottom: 20px; opacity: 0.9;">
+                Current Period vs Previous Period ({prev_start} to {prev_end})
+            </div>
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <div class="summary-value">{overall:.1f}<span style="font-size: 0.4em;" class="{overall_trend}"> {overall_change}</span></div>
+                    <div class="summary-label">Overall Score</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{gsc_clicks:,}<span style="font-size: 0.4em;" class="{gsc_clicks_trend}"> {gsc_clicks_change}</span></div>
+                    <div class="summary-label">Search Clicks</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{ga4_sessions:,}<span style="font-size: 0.4em;" class="{ga4_sessions_trend}"> {ga4_sessions_change}</span></div>
+                    <div class="summary-label">Web Sessions</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">{meta_impr:,}<span style="font-size: 0.4em;" class="{meta_impr_trend}"> {meta_impr_change}</span></div>
+                    <div class="summary-label">Social Impressions</div>
+                </div>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2 class="section-title">Performance Comparison</h2>
+            <div class="grid-2">
+                <div class="card">
+                    <h2>Search Performance (GSC)</h2>
+                    <table style="width:100%; font-size: 0.9em;">
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Metric</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Clicks</td><td style="text-align:right; padding:12px;">{gsc_clicks:,}</td><td style="text-align:right; padding:12px;">{prev_gsc_clicks:,}</td><td style="text-align:right; padding:12px;" class="{gsc_clicks_trend}">{gsc_clicks_change}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Impressions</td><td style="text-align:right; padding:12px;">{gsc_impr:,}</td><td style="text-align:right; padding:12px;">{prev_gsc_impr:,}</td><td style="text-align:right; padding:12px;">{gsc_impr_change}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Avg CTR</td><td style="text-align:right; padding:12px;">{gsc_ctr:.2%}</td><td style="text-align:right; padding:12px;">{prev_gsc_ctr:.2%}</td><td style="text-align:right; padding:12px;">{gsc_ctr_change:+.2f}%</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Avg Position</td><td style="text-align:right; padding:12px;">{gsc_pos:.1f}</td><td style="text-align:right; padding:12px;">{prev_gsc_pos:.1f}</td><td style="text-align:right; padding:12px;">{gsc_pos_change:+.1f}</td></tr>
+                    </table>
+                </div>
+                <div class="card">
+                    <h2>Web Analytics (GA4)</h2>
+                    <table style="width:100%; font-size: 0.9em;">
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Metric</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Sessions</td><td style="text-align:right; padding:12px;">{ga4_sessions:,}</td><td style="text-align:right; padding:12px;">{prev_ga4_sessions:,}</td><td style="text-align:right; padding:12px;" class="{ga4_sessions_trend}">{ga4_sessions_change}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Users</td><td style="text-align:right; padding:12px;">{ga4_users:,}</td><td style="text-align:right; padding:12px;">{prev_ga4_users:,}</td><td style="text-align:right; padding:12px;">{ga4_users_change:+d}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Bounce Rate</td><td style="text-align:right; padding:12px;">{ga4_bounce:.1%}</td><td style="text-align:right; padding:12px;">{prev_ga4_bounce:.1%}</td><td style="text-align:right; padding:12px;" class="{bounce_trend}">{bounce_diff:+.1f}%</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Conversions</td><td style="text-align:right; padding:12px;">{ga4_conversions}</td><td style="text-align:right; padding:12px;">{prev_ga4_conversions}</td><td style="text-align:right; padding:12px;">{conversions_change:+d}</td></tr>
+                    </table>
+                </div>
+            </div>
+            <div class="grid-2" style="margin-top: 20px;">
+                <div class="card">
+                    <h2>Social Media (Meta)</h2>
+                    <table style="width:100%; font-size: 0.9em;">
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Metric</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Impressions</td><td style="text-align:right; padding:12px;">{meta_impr:,}</td><td style="text-align:right; padding:12px;">{prev_meta_impr:,}</td><td style="text-align:right; padding:12px;" class="{meta_impr_trend}">{meta_impr_change}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Engagement Rate</td><td style="text-align:right; padding:12px;">{meta_er:.2%}</td><td style="text-align:right; padding:12px;">{prev_meta_er:.2%}</td><td style="text-align:right; padding:12px;">{meta_er_change:+.2f}%</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Page Fans</td><td style="text-align:right; padding:12px;">{meta_fans:,}</td><td style="text-align:right; padding:12px;">{prev_meta_fans:,}</td><td style="text-align:right; padding:12px;">{meta_fans_change:+d}</td></tr>
+                    </table>
+                </div>
+                <div class="card">
+                    <h2>Executive Scorecard</h2>
+                    <table style="width:100%; font-size: 0.9em;">
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Score</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Overall</td><td style="text-align:right; padding:12px;"><strong>{overall:.1f}</strong></td><td style="text-align:right; padding:12px;"><strong>{prev_overall:.1f}</strong></td><td style="text-align:right; padding:12px;" class="{overall_trend}"><strong>{overall_change}</strong></td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Search Visibility</td><td style="text-align:right; padding:12px;">{search_score:.1f}</td><td style="text-align:right; padding:12px;">{prev_search_score:.1f}</td><td style="text-align:right; padding:12px;">{search_score_change:+.1f}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">GA4 Performance</td><td style="text-align:right; padding:12px;">{ga4_score:.1f}</td><td style="text-align:right; padding:12px;">{prev_ga4_score:.1f}</td><td style="text-align:right; padding:12px;">{ga4_score_change:+.1f}</td></tr>
+                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Meta Performance</td><td style="text-align:right; padding:12px;">{meta_score:.1f}</td><td style="text-align:right; padding:12px;">{prev_meta_score:.1f}</td><td style="text-align:right; padding:12px;">{meta_score_change:+.1f}</td></tr>
+                    </table>
+                </div>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2 class="section-title">Key Takeaways & Executive Summary</h2>
+            {takeaways_html}
+        </div>
+        """
+
+# Action plan list item
+_LI = '<li style="margin: 12px 0;">{}</li>'.format
+
+# Immediate / short-term / long-term action plan columns (<li> items)
+_ACTION_PLAN_TEMPLATE = """<div class="grid-3">
+            <div class="card">
+                <h2>Immediate (This Week)</h2>
+                <ul style="margin: 15px 0 0 20px;">
+                    {immediate}
+                </ul>
+            </div>
+            <div class="card">
+                <h2>Short-Term (30 Days)</h2>
+                <ul style="margin: 15px 0 0 20px;">
+                    {short_term}
+                </ul>
+            </div>
+            <div class="card">
+                <h2>Long-Term (Quarter)</h2>
+                <ul style="margin: 15px 0 0 20px;">
+                    {long_term}
+                </ul>
+            </div>
+        </div>"""
+
+# AI insight accent colors by position; the fourth and later insights share the last
+_AI_COLORS = ("#198754", "#0d6efd", "#ffc107", "#7a7a7a")
+
+# AI recommendation CSS modifier and accent color by lowercased priority
+_AI_PRIORITY_CLASS = {"critical": "high", "high": "high", "growth": "growth"}
+_AI_PRIORITY_COLORS = {"critical": "#dc3545", "high": "#ffc107"}
+
+# AI insight and AI recommendation cards
+_AI_INSIGHT_HTML = """<div class="insight" style="border-left-color: {color};">
+                    {insight}
+                </div>"""
+_AI_REC_HTML = """<div class="recommendation {priority_class}" style="border-left-color: {color};">
+                    <div class="rec-priority">{priority} PRIORITY</div>
+                    <div class="rec-title">{title}</div>
+                    <div class="rec-desc">{description}</div>
+                    <div class="rec-action"><strong>Recommended Action:</strong> {action}</div>
+                </div>"""
+
+# Month-over-month takeaway cards (see DataAnalyst._generate_takeaways)
+_TAKEAWAY_SEARCH_UP = """<div class="insight" style="border-left-color: #198754;">
+                <strong>Positive Trend:</strong> Search clicks increased by {diff} (+{pct:.1f}%) compared to previous month.
+            </div>
+"""
+_TAKEAWAY_SEARCH_DOWN = """<div class="insight" style="border-left-color: #dc3545;">
+                <strong>Attention Needed:</strong> Search clicks decreased by {diff} ({pct:.1f}%) compared to previous month. Review SEO strategy.
+            </div>
+"""
+_TAKEAWAY_TRAFFIC_UP = """<div class="insight" style="border-left-color: #198754;">
+                <strong>Growth:</strong> Web traffic increased by {diff} sessions (+{pct:.1f}%) month-over-month.
+            </div>
+"""
+_TAKEAWAY_BOUNCE_DOWN = """<div class="insight" style="border-left-color: #198754;">
+                <strong>Improved Engagement:</strong> Bounce rate improved by {points:.1f} percentage points, indicating better user engagement.
+            </div>
+"""
+_TAKEAWAY_BOUNCE_UP = """<div class="insight" style="border-left-color: #dc3545;">
+                <strong>Engagement Warning:</strong> Bounce rate increased by {points:.1f} percentage points. Investigate user experience issues.
+            </div>
+"""
+_TAKEAWAY_CONVERSIONS_UP = """<div class="insight" style="border-left-color: #198754;">
+                <strong>Conversion Growth:</strong> Conversions increased from {prev} to {curr} (+{diff}).
+            </div>
+"""
+_TAKEAWAY_NO_CONVERSIONS = """<div class="insight" style="border-left-color: #dc3545;">
+                <strong>Critical Gap:</strong> No conversions tracked in either period. Immediate action required.
+            </div>
+"""
+_TAKEAWAY_SOCIAL_UP = """<div class="insight" style="border-left-color: #0d6efd;">
+                <strong>Social Growth:</strong> Social media impressions increased by {pct:.1f}%.
+            </div>
+"""
+_TAKEAWAY_SCORE_UP = """<div class="insight" style="border-left-color: #198754;">
+                <strong>Overall Improvement:</strong> Overall performance score improved by {points:.1f} points. Strong momentum.
+            </div>
+"""
+_TAKEAWAY_SCORE_DOWN = """<div class="insight" style="border-left-color: #dc3545;">
+                <strong>Performance Decline:</strong> Overall score dropped by {points:.1f} points. Review all channels.
+            </div>
+"""
+_TAKEAWAY_NONE = (
+    '<div class="insight">No significant changes detected between periods.</div>'
+)
+
+# Takeaway card per _movement() code (down, flat, up); None means no card
+_TAKEAWAY_SEARCH = (_TAKEAWAY_SEARCH_DOWN, None, _TAKEAWAY_SEARCH_UP)
+_TAKEAWAY_TRAFFIC = (None, None, _TAKEAWAY_TRAFFIC_UP)
+_TAKEAWAY_BOUNCE = (_TAKEAWAY_BOUNCE_DOWN, None, _TAKEAWAY_BOUNCE_UP)
+_TAKEAWAY_SOCIAL = (None, None, _TAKEAWAY_SOCIAL_UP)
+_TAKEAWAY_SCORE = (_TAKEAWAY_SCORE_DOWN, None, _TAKEAWAY_SCORE_UP)
+
+# Dynamic insight card (see _INSIGHT_RULES)
+_INSIGHT_HTML = """<div class="insight" style="border-left-color: {color};">
+                <strong>{title}</strong><br>
+                {body}
+            </div>
+"""
+
+_CRITICAL, _WARNING, _GOOD, _INFO = "#dc3545", "#ffc107", "#198754", "#0dcaf0"
+
+
+def _bucket(key: str, thresholds: Tuple, side: Callable = bisect_right) -> Callable:
+    """Index of ctx[key] among sorted thresholds (bisect_left makes them exclusive)"""
+    return lambda ctx: side(thresholds, ctx[key])
+
+
+# Insights in display order. Each entry is (select, cards): select maps the
+# metrics built by _insight_metrics to an index into cards. _insight_cards yields
+# the chosen (color, title, body) card, if any, and _generate_dynamic_insights
+# formats it against those metrics.
+_INSIGHT_RULES = (
+    # Search traffic
+    (
+        _bucket("gsc_clicks", (50, 200)),
+        (
+            (
+                _CRITICAL,
+                "Critical: Low Search Traffic",
+                "Only {gsc_clicks} clicks in the reporting period. Your SEO strategy needs immediate attention.\n"
+                "                Recommendation: Focus on ranking for long-tail keywords and optimize existing content.",
+            ),
+            (
+                _WARNING,
+                "Search Traffic Below Average",
+                "{gsc_clicks} clicks with {gsc_pos:.1f} average position. Room for improvement in rankings.\n"
+                "                Recommendation: Target keywords ranking positions 4-10 to move them to top 3.",
+            ),
+            (
+                _GOOD,
+                "Good Search Visibility",
+                "{gsc_clicks} clicks with {gsc_pos:.1f} average position. Keep building on this momentum.",
+            ),
+        ),
+    ),
+    # Search CTR
+    (
+        _bucket("gsc_ctr", (0.03,)),
+        (
+            (
+                _CRITICAL,
+                "Low CTR ({gsc_ctr:.1%})",
+                "Click-through rate is below industry average. Optimize title tags and meta descriptions.",
+            ),
+            None,
+        ),
+    ),
+    # Bounce rate
+    (
+        _bucket("ga4_bounce", (0.5, 0.7), bisect_left),
+        (
+            (
+                _GOOD,
+                "Healthy Bounce Rate ({ga4_bounce:.1%})",
+                "Good user engagement levels. Continue monitoring.",
+            ),
+            (
+                _WARNING,
+                "Elevated Bounce Rate ({ga4_bounce:.1%})",
+                "Consider improving user engagement and content relevance.",
+            ),
+            (
+                _CRITICAL,
+                "Critical: High Bounce Rate ({ga4_bounce:.1%})",
+                "Majority of visitors leave without engaging. This severely impacts conversions.\n"
+                "                Action: Audit landing pages, improve page load speed, enhance content quality.",
+            ),
+        ),
+    ),
+    # Conversions
+    (
+        lambda ctx: int(ctx["ga4_conversions"] != 0),
+        (
+            (
+                _CRITICAL,
+                "No Conversions Tracked",
+                "Zero conversions from {ga4_sessions} sessions. This is a critical gap.\n"
+                "                Action: Set up conversion events in GA4 for key actions (form submissions, purchases, signups).",
+            ),
+            (
+                _GOOD,
+                "{ga4_conversions} Conversions Recorded",
+                "{conv_rate:.2f}% conversion rate. Monitor to identify high-performing pages.",
+            ),
+        ),
+    ),
+    # Tracked events
+    (
+        lambda ctx: int(bool(ctx["top_events"])),
+        (
+            None,
+            (
+                _INFO,
+                "Top Tracked Events:",
+                "{event_names}. These represent user interactions on your site.",
+            ),
+        ),
+    ),
+    # Social reach
+    (
+        _bucket("meta_impressions", (10000, 100000), bisect_left),
+        (
+            None,
+            (
+                _WARNING,
+                "Moderate Social Presence",
+                "{meta_impressions:,} impressions. Increase posting frequency for better reach.",
+            ),
+            (
+                _GOOD,
+                "Strong Social Reach",
+                "{meta_impressions:,} impressions reaching {meta_fans:,} followers.\n"
+                "                Leverage this reach for website traffic.",
+            ),
+        ),
+    ),
+    # Social engagement
+    (
+        _bucket("meta_er", (0.02,)),
+        (
+            (
+                _CRITICAL,
+                "Low Engagement Rate ({meta_er:.2%})",
+                "Content may not be resonating. Try video content, polls, and questions.",
+            ),
+            None,
+        ),
+    ),
+    # Overall score
+    (
+        _bucket("overall", (50, 70)),
+        (
+            (
+                _CRITICAL,
+                "Overall Performance: {overall:.1f}/100 - Needs Attention",
+                "Multiple areas require improvement. Prioritize high-impact changes.",
+            ),
+            (
+                _WARNING,
+                "Overall Performance: {overall:.1f}/100",
+                "Moderate performance across channels. Focus on improving weak areas.",
+            ),
+            (
+                _GOOD,
+                "Overall Performance: {overall:.1f}/100",
+                "Strong multi-channel performance. Maintain current strategies.",
+            ),
+        ),
+    ),
+)
+
+# Executive summary block used when there is no monthly comparison
+_EXEC_SUMMARY_TEMPLATE = """
+        <div class="exec-summary">
+            <h2>Executive Summary</h2>
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <div class="summary-value" id="execScore">{overall:.1f}</div>
+                    <div class="summary-label">Overall Score</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value" id="execClicks">{clicks:,}</div>
+                    <div class="summary-label">Search Clicks</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value" id="execSessions">{sessions:,}</div>
+                    <div class="summary-label">Web Sessions</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value" id="execImpressions">{impressions:,}</div>
+                    <div class="summary-label">Social Impressions</div>
+                </div>
+            </div>
+        </div>"""
+
+# Table rows for events (name, count, sessions), top queries
+# (query, clicks, position, ctr) and devices (device, sessions, pct)
+_EVENT_ROW = '<tr style="border-bottom: 1px solid #eee;"><td style="padding:8px;">{0}</td><td style="text-align:right; padding:8px;">{1:,}</td><td style="text-align:right; padding:8px;">{2:,}</td></tr>'
+_QUERY_ROW = '<tr style="border-bottom: 1px solid #eee;"><td style="padding:10px;">{0}</td><td style="text-align:right; padding:10px;">{1}</td><td style="text-align:right; padding:10px;">{2:.1f}</td><td style="text-align:right; padding:10px;">{3:.1%}</td></tr>'
+_DEVICE_ROW = '<tr style="border-bottom: 1px solid #eee;"><td style="padding:10px;">{0}</td><td style="text-align:right; padding:10px;">{1:,}</td><td style="text-align:right; padding:10px;">{2:.1f}%</td></tr>'
+
+# Executive dashboard page. Split into parts by _compile_template and streamed
+# by _write_exec_dashboard; fields use %(name)s or %(name).Nf, and literal
+# percent signs are escaped as %%.
+_EXEC_DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>%(site_name)s - Executive Analytics Report</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/flatpickr/dist/flatpickr.min.css">
+    <script src="https://cdn.jsdelivr.net/npm/flatpickr"></script>
+    <script src="https://cdn.jsdelivr.net/npm/pako/dist/pako.min.js"></script>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif; background: #f8f9fa; color: #1a1a1a; line-height: 1.6; }
+        .container { max-width: 1400px; margin: 0 auto; padding: 30px 40px; background: white; min-height: 100vh; }
+        
+        /* Header */
+        .header { background: linear-gradient(135deg, #1a1a1a 0%%, #2d2d2d 100%%); color: white; padding: 35px 40px; margin: -40px -40px 40px -40px; }
+        .header-top { display: flex; justify-content: space-between; align-items: center; }
+        .header h1 { font-size: 2.2em; font-weight: 300; letter-spacing: 1px; }
+        .header .subtitle { font-size: 0.95em; opacity: 0.85; font-weight: 300; }
+        
+        /* Filter Bar */
+        .filter-bar { background: #fff; border: 1px solid #e0e0e0; padding: 20px 25px; margin-bottom: 35px; display: flex; align-items: center; gap: 20px; flex-wrap: wrap; }
+        .filter-bar label { font-weight: 600; color: #333; font-size: 0.9em; }
+        .filter-bar input { padding: 12px 15px; font-size: 1em; border: 2px solid #1a1a1a; border-radius: 6px; width: 220px; background: #fff; cursor: pointer; }
+        .filter-bar input:hover { border-color: #4a4a4a; }
+        .filter-bar button { padding: 12px 30px; font-size: 1em; background: #198754; color: white; border: none; border-radius: 6px; cursor: pointer; font-weight: 600; }
+        .filter-bar button:hover { background: #146c43; }
+        .filter-info { color: #666; font-size: 0.9em; }
+        
+        /* Sections */
+        .section { margin-bottom: 45px; }
+        .section-title { font-size: 1.1em; font-weight: 600; color: #1a1a1a; border-bottom: 2px solid #1a1a1a; padding-bottom: 12px; margin-bottom: 25px; text-transform: uppercase; letter-spacing: 1.5px; }
+        
+        /* Cards */
+        .card { border: 1px solid #e0e0e0; padding: 25px; margin-bottom: 20px; border-radius: 6px; }
+        .card h2 { font-size: 0.95em; font-weight: 600; margin-bottom: 20px; text-transform: uppercase; letter-spacing: 1px; color: #555; border-bottom: 1px solid #eee; padding-bottom: 12px; }
+        
+        /* Grid */
+        .grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; margin-bottom: 30px; }
+        .grid-3 { display: grid; grid-template-columns: repeat(3, 1fr); gap: 20px; }
+        .grid-2 { display: grid; grid-template-columns: repeat(2, 1fr); gap: 25px; }
+        
+        /* Executive Summary */
+        .exec-summary { background: linear-gradient(135deg, #1a1a1a 0%%, #2d2d2d 100%%); color: white; padding: 35px 40px; margin: -40px -40px 40px -40px; }
+        .exec-summary h2 { color: white; border-bottom: 1px solid rgba(255,255,255,0.2); }
+        .exec-summary .summary-grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 30px; margin-top: 25px; }
+        .exec-summary .summary-item { text-align: center; }
+        .exec-summary .summary-value { font-size: 2.8em; font-weight: 300; }
+        .exec-summary .summary-label { font-size: 0.8em; opacity: 0.75; text-transform: uppercase; letter-spacing: 1px; }
+        
+        /* Metrics */
+        .score-display { text-align: center; padding: 20px; }
+        .score { font-size: 3em; font-weight: 300; line-height: 1; }
+        .score-label { font-size: 0.8em; color: #666; text-transform: uppercase; letter-spacing: 1px; margin-top: 8px; }
+        
+        .metric { display: flex; justify-content: space-between; padding: 14px 0; border-bottom: 1px solid #f0f0f0; }
+        .metric:last-child { border-bottom: none; }
+        .metric-label { color: #666; font-size: 0.9em; }
+        .metric-value { font-weight: 600; font-size: 1.05em; }
+        
+        /* Color classes */
+        .score-good { color: #198754; }
+        .score-neutral { color: #6c757d; }
+        .score-bad { color: #dc3545; }
+        .metric-good { color: #198754; }
+        .metric-bad { color: #dc3545; }
+        .trend-up { color: #198754; font-weight: 600; }
+        .trend-down { color: #dc3545; font-weight: 600; }
+        .trend-stable { color: #6c757d; }
+        
+        /* Charts */
+        .chart-container { position: relative; height: 280px; margin: 15px 0; }
+        
+        /* Recommendations */
+        .recommendation { border-left: 4px solid #1a1a1a; padding: 20px 25px; margin: 18px 0; background: #fafafa; border-radius: 0 6px 6px 0; }
+        .recommendation.high { border-left-color: #dc3545; background: #fff5f5; }
+        .recommendation.growth { border-left-color: #198754; background: #f0fff4; }
+        .rec-priority { font-size: 0.75em; font-weight: 600; text-transform: uppercase; letter-spacing: 1.5px; margin-bottom: 6px; }
+        .rec-title { font-weight: 600; margin-bottom: 10px; font-size: 1.05em; }
+        .rec-desc { color: #555; font-size: 0.95em; line-height: 1.5; }
+        .rec-action { margin-top: 14px; padding-top: 14px; border-top: 1px solid #ddd; font-size: 0.9em; color: #333; }
+        
+        /* Insights */
+        .insight { padding: 18px 22px; margin: 12px 0; background: #f8f9fa; border-left: 3px solid #666; border-radius: 0 4px 4px 0; }
+        
+        /* Footer */
+        .footer { margin-top: 50px; padding-top: 25px; border-top: 1px solid #ddd; font-size: 0.8em; color: #888; text-align: center; }
+        
+        /* Responsive */
+        @media (max-width: 1200px) { .grid { grid-template-columns: repeat(2, 1fr); } .exec-summary .summary-grid { grid-template-columns: repeat(2, 1fr); } }
+        @media (max-width: 768px) { .grid { grid-template-columns: 1fr; } .grid-2 { grid-template-columns: 1fr; } .container { padding: 20px; } .header { margin: -20px -20px 30px -20px; padding: 25px; } .filter-bar { flex-direction: column; align-items: stretch; } .filter-bar input { width: 100%%; } }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <!-- Header -->
+        <div class="header">
+            <div class="header-top">
+                <div>
+                    <h1>%(site_name)s</h1>
+                    <div class="subtitle">Executive Analytics Report</div>
+                </div>
+                <div style="text-align: right; opacity: 0.85;">
+                    %(trend_html)s<br>
+                    <span style="font-size: 0.85em;">Vincent John Rodriguez</span>
+                </div>
+            </div>
+        </div>
+
+        <!-- Date Filter -->
+        <div class="filter-bar">
+            <label>Date Range:</label>
+            <input type="text" id="dateRange" placeholder="Select date range...">
+            <button onclick="applyDateFilter()">Apply Filter</button>
+            <span class="filter-info" id="filterInfo">Showing data for: Last %(days)s days</span>
+        </div>
+
+        <!-- Executive Summary -->
+        %(exec_summary_html)s
+
+        <!-- Performance Scores -->
+        <div class="section">
+            <h2 class="section-title">Performance Scores</h2>
+            <div class="grid">
+                <div class="card">
+                    <div class="score-display">
+                        <div class="score" id="scoreOverall">%(score_overall).1f</div>
+                        <div class="score-label">Overall Score /100</div>
+                    </div>
+                </div>
+                <div class="card">
+                    <h2>Search Visibility</h2>
+                    <div class="metric">
+                        <span class="metric-label">Score</span>
+                        <span class="metric-value" id="scoreGsc">%(score_gsc).1f</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Clicks</span>
+                        <span class="metric-value" id="gscClicks">%(gsc_clicks)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Impressions</span>
+                        <span class="metric-value" id="gscImpressions">%(gsc_impressions)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Avg CTR</span>
+                        <span class="metric-value" id="gscCtr">%(gsc_ctr)s</span>
+                    </div>
+                </div>
+                <div class="card">
+                    <h2>Web Analytics</h2>
+                    <div class="metric">
+                        <span class="metric-label">Score</span>
+                        <span class="metric-value" id="scoreGa4">%(score_ga4).1f</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Sessions</span>
+                        <span class="metric-value" id="ga4Sessions">%(ga4_sessions)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Users</span>
+                        <span class="metric-value" id="ga4Users">%(ga4_users)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Bounce Rate</span>
+                        <span class="metric-value" id="ga4Bounce">%(ga4_bounce)s</span>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- GA4 Events Section -->
+        <div class="section" id="eventsSection">
+            <h2 class="section-title">Event Tracking & Conversions</h2>
+            <div class="grid-2">
+                <div class="card">
+                    <h2>Event Summary</h2>
+                    <div class="metric">
+                        <span class="metric-label">Total Events</span>
+                        <span class="metric-value" id="totalEvents">%(total_events)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Event Types</span>
+                        <span class="metric-value" id="totalEventTypes">%(total_event_types)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Sessions with Events</span>
+                        <span class="metric-value" id="sessionsWithEvents">%(sessions_with_events)s</span>
+                    </div>
+                </div>
+                <div class="card">
+                    <h2>Top Events</h2>
+                    <table style="width:100%%; border-collapse: collapse; font-size: 0.85em;" id="eventsTable">
+                        <tr style="border-bottom: 2px solid #000;"><th style="text-align:left; padding:8px;">Event</th><th style="text-align:right; padding:8px;">Count</th><th style="text-align:right; padding:8px;">Sessions</th></tr>
+                        %(event_rows)s
+                    </table>
+                </div>
+            </div>
+        </div>
+
+        <!-- Social Performance -->
+        <div class="section">
+            <h2 class="section-title">Social Performance</h2>
+            <div class="grid-2">
+                <div class="card">
+                    <h2>Social Score</h2>
+                    <div class="metric">
+                        <span class="metric-label">Score</span>
+                        <span class="metric-value" id="scoreMeta">%(score_meta).1f</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Impressions</span>
+                        <span class="metric-value" id="metaImpressions">%(meta_impressions)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Followers</span>
+                        <span class="metric-value" id="metaFollowers">%(meta_followers)s</span>
+                    </div>
+                    <div class="metric">
+                        <span class="metric-label">Engagement</span>
+                        <span class="metric-value" id="metaEngagement">%(meta_engagement)s</span>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- Charts -->
+        <div class="section">
+            <h2 class="section-title">Performance Charts</h2>
+            <div class="grid-2">
+                <div class="card">
+                    <h2>Channel Performance Comparison</h2>
+                    <div class="chart-container">
+                        <canvas id="channelChart"></canvas>
+                    </div>
+                </div>
+                <div class="card">
+                    <h2>Traffic Distribution</h2>
+                    <div class="chart-container">
+                        <canvas id="trafficChart"></canvas>
+                    </div>
+                </div>
+            </div>
+            <div class="grid-2">
+                <div class="card">
+                    <h2>Key Metrics Overview</h2>
+                    <div class="chart-container">
+                        <canvas id="metricsChart"></canvas>
+                    </div>
+                </div>
+                <div class="card">
+                    <h2>Engagement Rates</h2>
+                    <div class="chart-container">
+                        <canvas id="engagementChart"></canvas>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- Detailed Tables -->
+        <div class="section">
+            <h2 class="section-title">Detailed Analysis</h2>
+            <div class="grid-2">
+                <div class="card">
+                    <h2>Top Performing Queries</h2>
+                    <table style="width:100%%; border-collapse: collapse; font-size: 0.9em;">
+                        <tr style="border-bottom: 2px solid #000;"><th style="text-align:left; padding:10px;">Query</th><th style="text-align:right; padding:10px;">Clicks</th><th style="text-align:right; padding:10px;">Position</th><th style="text-align:right; padding:10px;">CTR</th></tr>
+%(query_rows)s
+                    </table>
+                </div>
+                <div class="card">
+                    <h2>Device Breakdown</h2>
+                    <table style="width:100%%; border-collapse: collapse; font-size: 0.9em;">
+                        <tr style="border-bottom: 2px solid #000;"><th style="text-align:left; padding:10px;">Device</th><th style="text-align:right; padding:10px;">Sessions</th><th style="text-align:right; padding:10px;">%%</th></tr>
+%(device_rows)s
+                    </table>
+                </div>
+            </div>
+        </div>
+
+        <!-- Key Insights -->
+        <div class="section">
+            <h2 class="section-title">Key Insights & Analysis</h2>
+            %(insights_html)s
+        </div>
+
+        <!-- Strategic Recommendations -->
+        <div class="section">
+            <h2 class="section-title">Strategic Recommendations</h2>
+%(recommendations_html)s
+        </div>
+
+        <!-- Action Plan -->
+        <div class="section">
+            <h2 class="section-title">Action Plan</h2>
+            %(action_plan_html)s
+        </div>
+
+        <!-- Footer -->
+        <div class="footer">
+            <p><strong>Report Generated:</strong> %(now_str)s | <strong>Author:</strong> Vincent John Rodriguez | <strong>Confidential</strong></p>
+            <p>This report contains confidential business information. Distribution is limited to authorized personnel only.</p>
+        </div>
+    </div>
+
+    <!-- Embedded Data -->
+    <script>
+        // Report Data (gzipped JSON, base64-encoded)
+        const reportData = JSON.parse(pako.ungzip(
+            Uint8Array.from(atob("%(report_data_b64)s"), c => c.charCodeAt(0)),
+            { to: 'string' }
+        ));
+
+        // Initialize Date Picker - Click to open calendar
+        let datePicker;
+        let filterTimer = null;
+        document.addEventListener('DOMContentLoaded', function() {
+            datePicker = flatpickr("#dateRange", {
+                mode: "range",
+                dateFormat: "Y-m-d",
+                defaultDate: ["%(default_start)s", "%(default_end)s"],
+                maxDate: "today",
+                inline: false,
+                showMonths: 1,
+                appendTo: document.querySelector('.filter-bar'),
+                position: "below",
+                onClose: function(selectedDates, dateStr, instance) {
+                    if (selectedDates.length === 2) {
+                        clearTimeout(filterTimer);
+                        filterTimer = setTimeout(applyDateFilter, 150);
+                    }
+                }
+            });
+        });
+
+        // Chart Color Palette (Professional)
+        const colors = {
+            primary: '#1a1a1a',
+            secondary: '#4a4a4a',
+            tertiary: '#7a7a7a',
+            success: '#198754',
+            danger: '#dc3545',
+            warning: '#ffc107',
+            info: '#0dcaf0',
+            chartColors: ['#1a1a1a', '#4a4a4a', '#7a7a7a', '#198754', '#dc3545', '#0d6efd', '#ffc107']
+        };
+
+        // Per-chart palettes, shared by every chart config
+        const CHANNEL_COLORS = Object.freeze([colors.primary, colors.secondary, colors.tertiary]);
+        const METRIC_COLORS = Object.freeze([colors.success, '#0d6efd', colors.warning]);
+        const ENG_COLORS = Object.freeze([colors.success, colors.primary, colors.danger]);
+
+        // Shared chart options: no animation, data is pre-shaped so Chart.js skips parsing
+        const FAST_CHART_OPTIONS = { animation: false, parsing: false, normalized: true };
+
+        // Bar values as {x, y} points keyed by label index (the category scale's internal value)
+        function barPoints(values, horizontal = false) {
+            return values.map((v, i) => horizontal ? { x: v, y: i } : { x: i, y: v });
+        }
+
+        // Chart datasets derived from report data
+        function chartSeries(data) {
+            const s = data.scores || {}, g = data.gsc || {}, a = data.ga4 || {}, m = data.meta || {};
+            return {
+                channelChart: barPoints([s.search_visibility || 0, s.ga4_performance || 0, s.meta_performance || 0]),
+                trafficChart: [g.total_clicks || 1, a.total_sessions || 1, Math.floor((m.total_impressions || 1)/1000)],
+                metricsChart: barPoints([g.total_clicks || 0, a.total_sessions || 0, Math.floor((m.total_impressions || 0)/1000)], true),
+                engagementChart: barPoints([
+                    (g.average_ctr || 0) * 100, 
+                    (m.engagement_rate || 0) * 100, 
+                    (a.conversion_rate || 0) * 100
+                ])
+            };
+        }
 
-1. KEY INSIGHTS (3-4 bullet points): Identify the most critical findings about performance, user behavior, and growth opportunities. Each insight should be 1-2 sentences.
+        // Chart.js inside a worker, drawing to OffscreenCanvas; posts 'ready' once the library loads
+        const CHART_WORKER_SRC = `
+            importScripts('https://cdn.jsdelivr.net/npm/chart.js');
+            const charts = {};
+            onmessage = (e) => {
+                const msg = e.data;
+                if (msg.type === 'init') {
+                    charts[msg.id] = new Chart(msg.canvas, msg.config);
+                    charts[msg.id].resize(msg.width, msg.height);
+                } else if (msg.type === 'update') {
+                    charts[msg.id].data.datasets[0].data = msg.data;
+                    charts[msg.id].update('none');
+                } else if (msg.type === 'resize') {
+                    charts[msg.id].resize(msg.width, msg.height);
+                }
+            };
+            postMessage('ready');
+        `;
+        let chartWorker = null;
+
+        // How long the worker may take to load its own copy of Chart.js
+        const CHART_WORKER_TIMEOUT_MS = 1500;
+
+        // Resolves to a ready chart worker, or null to render on the main thread
+        // (also when the worker's Chart.js download is slower than the timeout)
+        function startChartWorker() {
+            if (!window.Worker || !window.OffscreenCanvas ||
+                !('transferControlToOffscreen' in HTMLCanvasElement.prototype)) {
+                return Promise.resolve(null);
+            }
+            const started = new Promise(resolve => {
+                let worker;
+                try {
+                    worker = new Worker(URL.createObjectURL(new Blob([CHART_WORKER_SRC], { type: 'text/javascript' })));
+                } catch (e) {
+                    resolve(null);
+                    return;
+                }
+                worker.onmessage = e => resolve(e.data === 'ready' ? worker : null);
+                worker.onerror = () => { worker.terminate(); resolve(null); };
+            });
+            const timedOut = new Promise(resolve => setTimeout(() => resolve(null), CHART_WORKER_TIMEOUT_MS));
+            return Promise.race([started, timedOut]).then(worker => {
+                // A worker that becomes ready after the timeout is not used
+                if (!worker) started.then(late => late && late.terminate());
+                return worker;
+            });
+        }
 
-2. STRATEGIC RECOMMENDATIONS (5-7 items): Provide specific, actionable recommendations with priority levels (Critical/High/Medium). Include the specific metric that needs attention and concrete action to take.
+        // Series last applied to the charts; charts built later start from it
+        let latestSeries = null;
 
-3. ACTION PLAN: Organize actions into:
-   - Immediate (This Week): 3-4 urgent actions
-   - Short-Term (30 Days): 4-5 strategic actions  
-   - Long-Term (Quarter): 3-4 growth initiatives
+        // Run build() the first time el scrolls into view (immediately without IntersectionObserver)
+        function whenVisible(el, build) {
+            if (typeof IntersectionObserver === 'undefined') {
+                build();
+                return;
+            }
+            const io = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    io.disconnect();
+                    build();
+                }
+            });
+            io.observe(el);
+        }
 
-Use a professional, executive-level tone. Focus on business impact. Include specific numbers from the data.
+        // Create a chart once its canvas is visible
+        function createChart(id, config) {
+            const canvas = document.getElementById(id);
+            if (!canvas) return;
+            whenVisible(canvas, () => {
+                config.data.datasets[0].data = latestSeries[id];
+                buildChart(id, canvas, config);
+            });
+        }
 
-Data:
-{data_summary}
+        // Build a chart on the worker when available (static, without tooltips); currentCharts
+        // gets an object with the same data/update() surface either way, so updateCharts is unchanged
+        function buildChart(id, canvas, config) {
+            if (!chartWorker) {
+                currentCharts[id] = new Chart(canvas, config);
+                return;
+            }
+            const box = canvas.parentElement;
+            canvas.style.width = '100%%';
+            canvas.style.height = '100%%';
+            const offscreen = canvas.transferControlToOffscreen();
+            config.options.responsive = false;
+            config.options.devicePixelRatio = window.devicePixelRatio || 1;
+            // An OffscreenCanvas receives no DOM events: no hover, tooltips or legend clicks
+            config.options.events = [];
+            config.options.plugins = { ...config.options.plugins, tooltip: { enabled: false } };
+            chartWorker.postMessage(
+                { type: 'init', id, canvas: offscreen, config, width: box.clientWidth, height: box.clientHeight },
+                [offscreen]
+            );
+            new ResizeObserver(() => chartWorker.postMessage(
+                { type: 'resize', id, width: box.clientWidth, height: box.clientHeight }
+            )).observe(box);
+            currentCharts[id] = {
+                data: config.data,
+                update() {
+                    chartWorker.postMessage({ type: 'update', id, data: config.data.datasets[0].data });
+                }
+            };
+        }
 
-Format your response as JSON with keys: "insights", "recommendations", "action_plan_immediate", "action_plan_short", "action_plan_long". Each recommendation should have: priority, title, description, action."""
+        // Initialize Charts once; later filters update them in place. A filter applied
+        // while the chart worker was loading has already set latestSeries, so keep it
+        function initCharts() {
+            const series = latestSeries = latestSeries || chartSeries(reportData);
 
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.openrouter_api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://data-analyst-agent.local",
-                    "X-Title": "Data Analyst Agent",
+            // Channel Performance Chart - with distinct colors
+            createChart('channelChart', {
+                type: 'bar',
+                data: {
+                    labels: ['Search', 'Web', 'Social'],
+                    datasets: [{
+                        label: 'Score',
+                        data: series.channelChart,
+                        backgroundColor: CHANNEL_COLORS,
+                        borderColor: CHANNEL_COLORS,
+                        borderWidth: 1
+                    }]
                 },
-                json={
-                    "model": "anthropic/claude-3-haiku",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 2000,
+                options: {
+                    ...FAST_CHART_OPTIONS,
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: { legend: { display: false } },
+                    scales: { y: { beginAtZero: true, max: 100 } }
+                }
+            });
+
+            // Traffic Distribution Chart - doughnut with colors
+            createChart('trafficChart', {
+                type: 'doughnut',
+                data: {
+                    labels: ['Search Clicks', 'Web Sessions', 'Social Impressions'],
+                    datasets: [{
+                        data: series.trafficChart,
+                        backgroundColor: CHANNEL_COLORS,
+                        borderWidth: 2,
+                        borderColor: '#ffffff'
+                    }]
                 },
-                timeout=30,
-            )
+                options: {
+                    ...FAST_CHART_OPTIONS,
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: { legend: { position: 'bottom' } }
+                }
+            });
 
-            if response.status_code == 200:
-                result = response.json()
-                content = (
-                    result.get("choices", [{}])[0].get("message", {}).get("content", "")
-                )
+            // Metrics Overview Chart - horizontal bar
+            createChart('metricsChart', {
+                type: 'bar',
+                data: {
+                    labels: ['Clicks', 'Sessions', 'Impressions (K)'],
+                    datasets: [{
+                        label: 'Volume',
+                        data: series.metricsChart,
+                        backgroundColor: METRIC_COLORS,
+                        borderWidth: 0
+                    }]
+                },
+                options: {
+                    ...FAST_CHART_OPTIONS,
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    indexAxis: 'y',
+                    plugins: { legend: { display: false } }
+                }
+            });
 
-                # Try to parse JSON from response
-                import re
+            // Engagement Chart
+            createChart('engagementChart', {
+                type: 'bar',
+                data: {
+                    labels: ['CTR', 'Engagement', 'Conversion'],
+                    datasets: [{
+                        label: 'Rate (%%)',
+                        data: series.engagementChart,
+                        backgroundColor: ENG_COLORS
+                    }]
+                },
+                options: {
+                    ...FAST_CHART_OPTIONS,
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: { legend: { display: false } },
+                    scales: { y: { beginAtZero: true } }
+                }
+            });
+        }
 
-                json_match = re.search(r"\{[\s\S]*\}", content)
-                if json_match:
-                    import json
+        // Store original data for filtering
+        const originalData = typeof structuredClone === 'function'
+            ? structuredClone(reportData)
+            : JSON.parse(JSON.stringify(reportData));
+        let currentCharts = {};
+
+        // Metric elements, looked up once (the script runs after the markup)
+        const METRIC_ELS = Object.fromEntries([
+            'execScore', 'execClicks', 'execSessions', 'execImpressions',
+            'scoreGsc', 'gscClicks', 'gscImpressions', 'gscCtr',
+            'scoreGa4', 'ga4Sessions', 'ga4Users', 'ga4Bounce',
+            'totalEvents', 'totalEventTypes', 'sessionsWithEvents',
+            'scoreMeta', 'metaImpressions', 'metaFollowers', 'metaEngagement'
+        ].map(id => [id, document.getElementById(id)]));
 
-                    try:
-                        ai_data = json.loads(json_match.group())
-                        print("✅ AI Insights generated successfully")
-                        return ai_data
-                    except:
-                        pass
+        // Update metric display
+        function updateMetric(id, value, isPct = false) {
+            const el = METRIC_ELS[id];
+            if (el) {
+                el.textContent = isPct ? value.toFixed(2) + '%%' : (typeof value === 'number' ? value.toLocaleString() : value);
+            }
+        }
 
-            print(f"⚠️ AI generation returned: {response.status_code}")
-            return None
+        // Update all metrics from data
+        function updateMetricsFromData(data) {
+            if (!data) return;
+            const s = data.scores || {}, g = data.gsc || {}, a = data.ga4 || {}, m = data.meta || {};
+            
+            // Executive Summary
+            updateMetric('execScore', s.overall || 0);
+            updateMetric('execClicks', g.total_clicks || 0);
+            updateMetric('execSessions', a.total_sessions || 0);
+            updateMetric('execImpressions', m.total_impressions || 0);
+            
+            // GSC Metrics
+            updateMetric('scoreGsc', s.search_visibility || 0);
+            updateMetric('gscClicks', g.total_clicks || 0);
+            updateMetric('gscImpressions', g.total_impressions || 0);
+            updateMetric('gscCtr', (g.average_ctr || 0) * 100, true);
+            
+            // GA4 Metrics
+            updateMetric('scoreGa4', s.ga4_performance || 0);
+            updateMetric('ga4Sessions', a.total_sessions || 0);
+            updateMetric('ga4Users', a.total_users || 0);
+            updateMetric('ga4Bounce', (a.bounce_rate || 0) * 100, true);
+            
+            // Events
+            if (a.events) {
+                const e = a.events;
+                updateMetric('totalEvents', e.total_events || 0);
+                updateMetric('totalEventTypes', e.total_event_types || 0);
+                updateMetric('sessionsWithEvents', e.sessions_with_events || 0);
+            }
+            
+            // Meta Metrics
+            updateMetric('scoreMeta', s.meta_performance || 0);
+            updateMetric('metaImpressions', m.total_impressions || 0);
+            updateMetric('metaFollowers', m.total_fans || 0);
+            updateMetric('metaEngagement', (m.engagement_rate || 0) * 100, true);
+        }
 
-        except Exception as e:
-            print(f"⚠️ AI insights generation failed: {e}")
-            return None
+        // Refresh charts in place with new data (no teardown, no animation)
+        function updateCharts(data) {
+            if (!data) return;
+            const series = latestSeries = chartSeries(data);
+            for (const [name, chart] of Object.entries(currentCharts)) {
+                chart.data.datasets[0].data = series[name];
+                chart.update('none');
+            }
+        }
 
-    def _generate_comparison_html(
-        self,
-        gsc,
-        prev_gsc,
-        ga4,
-        prev_ga4,
-        meta,
-        prev_meta,
-        scores,
-        prev_scores,
-        prev_start,
-        prev_end,
-    ) -> str:
-        """Generate C-suite style comparison HTML for monthly reports"""
+        // Coalesce metric/chart refreshes into at most one per animation frame
+        let pendingUpdate = null;
+        let pendingData = null;
+        function requestUpdate(data) {
+            pendingData = data;
+            if (pendingUpdate) return;
+            pendingUpdate = requestAnimationFrame(() => {
+                pendingUpdate = null;
+                updateMetricsFromData(pendingData);
+                updateCharts(pendingData);
+            });
+        }
 
-        gsc_clicks = gsc.get("total_clicks", 0)
-        prev_gsc_clicks = prev_gsc.get("total_clicks", 0)
-        gsc_clicks_diff = gsc_clicks - prev_gsc_clicks
-        gsc_clicks_pct = (
-            (gsc_clicks_diff / prev_gsc_clicks * 100) if prev_gsc_clicks > 0 else 0
-        )
+        // Report scaled by a date-range ratio; recent ratios kept in a small LRU
+        const SCALE_CACHE_SIZE = 32;
+        const scaleCache = new Map();
+        function scaleReport(ratio) {
+            const key = ratio.toFixed(3);
+            const cached = scaleCache.get(key);
+            if (cached) {
+                scaleCache.delete(key);
+                scaleCache.set(key, cached);
+                return cached;
+            }
+            const value = {
+                gsc: {
+                    total_clicks: Math.round(originalData.gsc.total_clicks * ratio),
+                    total_impressions: Math.round(originalData.gsc.total_impressions * ratio),
+                    average_ctr: originalData.gsc.average_ctr,
+                    average_position: originalData.gsc.average_position,
+                    top_queries: originalData.gsc.top_queries || []
+                },
+                ga4: {
+                    total_sessions: Math.round(originalData.ga4.total_sessions * ratio),
+                    total_users: Math.round(originalData.ga4.total_users * ratio),
+                    total_pageviews: Math.round((originalData.ga4.total_pageviews || originalData.ga4.total_sessions * 2) * ratio),
+                    bounce_rate: originalData.ga4.bounce_rate,
+                    conversions: Math.round(originalData.ga4.conversions * ratio),
+                    conversion_rate: originalData.ga4.conversion_rate,
+                    device_breakdown: originalData.ga4.device_breakdown || {},
+                    events: originalData.ga4.events || {}
+                },
+                meta: {
+                    total_impressions: Math.round(originalData.meta.total_impressions * ratio),
+                    total_engaged_users: Math.round(originalData.meta.total_engaged_users * ratio),
+                    total_fans: originalData.meta.total_fans,
+                    engagement_rate: originalData.meta.engagement_rate
+                },
+                scores: originalData.scores
+            };
+            scaleCache.set(key, value);
+            if (scaleCache.size > SCALE_CACHE_SIZE) {
+                scaleCache.delete(scaleCache.keys().next().value);
+            }
+            return value;
+        }
 
-        gsc_impr = gsc.get("total_impressions", 0)
-        prev_gsc_impr = prev_gsc.get("total_impressions", 0)
-        gsc_impr_diff = gsc_impr - prev_gsc_impr
+        // Apply Filter Function
+        function applyDateFilter() {
+            const dateRange = document.getElementById('dateRange').value;
+            if (dateRange) {
+                const dates = dateRange.split(' to ');
+                if (dates.length === 2) {
+                    const startDate = new Date(dates[0]);
+                    const endDate = new Date(dates[1]);
+                    const defaultStart = new Date("%(default_start)s");
+                    const defaultEnd = new Date("%(default_end)s");
+                    
+                    // Calculate the day difference
+                    const selectedDays = Math.round((endDate - startDate) / (1000 * 60 * 60 * 24));
+                    const originalDays = %(original_days)s;
+                    
+                    // Calculate proportional ratio (capped at reasonable bounds)
+                    let ratio = selectedDays / originalDays;
+                    if (ratio < 0.1) ratio = 0.1;
+                    if (ratio > 3) ratio = 3;
+                    
+                    // Update the filter info
+                    document.getElementById('filterInfo').textContent = 'Showing data for: ' + dates[0] + ' to ' + dates[1] + ' (' + selectedDays + ' days - estimated)';
+                    
+                    // Scale the report to the selected date range (memoized per ratio)
+                    const scaledData = scaleReport(ratio);
+                    
+                    // Update metrics and re-render charts with scaled data
+                    requestUpdate(scaledData);
+                    
+                    // Show info banner
+                    const infoBanner = document.createElement('div');
+                    infoBanner.id = 'dateFilterBanner';
+                    infoBanner.style.cssText = 'background: #fff3cd; border: 1px solid #ffc107; padding: 12px 20px; margin-bottom: 20px; border-radius: 6px; color: #856404;';
+                    infoBanner.innerHTML = '<strong>Note:</strong> Showing estimated data based on proportional calculation (' + selectedDays + ' days vs original ' + originalDays + ' days). For accurate data, run the agent with: <code style="background: #f0f0f0; padding: 4px 8px; border-radius: 4px; font-size: 0.9em;">python data_analyst.py %(site_name)s --days ' + selectedDays + '</code>';
+                    
+                    // Remove old banner if exists
+                    const existing = document.getElementById('dateFilterBanner');
+                    if (existing) existing.remove();
+                    
+                    // Add new banner after the filter bar
+                    document.querySelector('.filter-bar').after(infoBanner);
+                    
+                    // Scroll to top
+                    window.scrollTo({ top: 0, behavior: 'smooth' });
+                }
+            }
+        }
 
-        gsc_ctr = gsc.get("average_ctr", 0)
-        prev_gsc_ctr = prev_gsc.get("average_ctr", 0)
+        // Initialize on load
+        window.onload = function() {
+            startChartWorker().then(worker => {
+                chartWorker = worker;
+                initCharts();
+            });
+        };
+    </script>
+</body>
+</html>"""
+
+# "%%", a supported field, or any other "%" (rejected by _compile_template)
+_TEMPLATE_FIELD = re.compile(r"%(?:%|\((\w+)\)(\.\d+f|s)|.{0,20})", re.S)
+
+
+def _compile_template(template: str) -> Tuple:
+    """Split a %-style template into UTF-8 literals and (key, conversion) fields"""
+    parts = []
+    pos = 0
+    for match in _TEMPLATE_FIELD.finditer(template):
+        if match.group(0) == "%%":
+            continue
+        if not match.group(1):
+            raise ValueError(f"Unsupported template field: {match.group(0)!r}")
+        parts.append(template[pos : match.start()].replace("%%", "%").encode("utf-8"))
+        parts.append((match.group(1), "%" + match.group(2)))
+        pos = match.end()
+    parts.append(template[pos:].replace("%%", "%").encode("utf-8"))
+    return tuple(parts)
+
+
+_EXEC_DASHBOARD_PARTS = _compile_template(_EXEC_DASHBOARD_TEMPLATE)
+
+
+def _write_exec_dashboard(write: Callable, values: Dict, report_data_b64: str) -> None:
+    """Write the executive dashboard as UTF-8 bytes, section by section"""
+    for part in _EXEC_DASHBOARD_PARTS:
+        if isinstance(part, bytes):
+            write(part)
+        elif part[0] == "report_data_b64":
+            write(report_data_b64.encode("ascii"))
+        else:
+            key, conversion = part
+            write((conversion % (values[key],)).encode("utf-8"))
 
-        ga4_sessions = ga4.get("total_sessions", 0)
-        prev_ga4_sessions = prev_ga4.get("total_sessions", 0)
-        ga4_sessions_diff = ga4_sessions - prev_ga4_sessions
-        ga4_sessions_pct = (
-            (ga4_sessions_diff / prev_ga4_sessions * 100)
-            if prev_ga4_sessions > 0
-            else 0
-        )
 
-        ga4_users = ga4.get("total_users", 0)
-        prev_ga4_users = prev_ga4.get("total_users", 0)
+# Scheme prefix stripped from site URLs when naming output files
+_URL_SCHEME = re.compile(r"^https?://")
 
-        ga4_bounce = ga4.get("bounce_rate", 0)
-        prev_ga4_bounce = prev_ga4.get("bounce_rate", 0)
-        bounce_diff = (ga4_bounce - prev_ga4_bounce) * 100
+# LLM action prompt written next to each report, filled in by main()
+_PROMPT_TEMPLATE = """# Analytics Report - LLM Action Prompt
 
-        ga4_conversions = ga4.get("conversions", 0)
-        prev_ga4_conversions = prev_ga4.get("conversions", 0)
+You are a senior digital marketing strategist. Analyze the following website analytics data and provide actionable recommendations.
 
-        meta_impr = meta.get("total_impressions", 0)
-        prev_meta_impr = prev_meta.get("total_impressions", 0)
-        meta_impr_diff = meta_impr - prev_meta_impr
-        meta_impr_pct = (
-            (meta_impr_diff / prev_meta_impr * 100) if prev_meta_impr > 0 else 0
-        )
+## Report Details
+- **Website**: {site_url}
+- **Report Type**: {report_type}
+- **Period**: {start_date} to {end_date}
+- **Generated**: {generated}
+- **Author**: Vincent John Rodriguez
 
-        meta_er = meta.get("engagement_rate", 0)
-        prev_meta_er = prev_meta.get("engagement_rate", 0)
+---
 
-        overall = scores.get("overall", 0)
-        prev_overall = prev_scores.get("overall", 0)
-        overall_diff = overall - prev_overall
+## Current Performance Data
 
-        def trend_class(val, inverse=False):
-            if inverse:
-                return (
-                    "trend-down"
-                    if val > 0
-                    else "trend-up"
-                    if val < 0
-                    else "trend-stable"
-                )
-            return (
-                "trend-up" if val > 0 else "trend-down" if val < 0 else "trend-stable"
-            )
+### Google Search Console (GSC) - Search Performance
+```
+{gsc_data}
+```
 
-        def fmt_num(n):
-            return f"{n:,.0f}" if abs(n) >= 100 else f"{n:+.1f}"
+### Google Analytics 4 (GA4) - Web Analytics
+```
+{ga4_data}
+```
 
-        def fmt_pct(p):
-            return f"{p:+.1f}%"
+### Meta/Facebook - Social Performance
+```
+{meta_data}
+```
 
-        html = f'''
-        <div class="exec-summary">
-            <h2>Executive Summary - Month over Month Analysis</h2>
-            <div style="font-size: 0.9em; margin-bottom: 20px; opacity: 0.9;">
-                Current Period vs Previous Period ({prev_start} to {prev_end})
-            </div>
-            <div class="summary-grid">
-                <div class="summary-item">
-                    <div class="summary-value">{overall:.1f}<span style="font-size: 0.4em;" class="{trend_class(overall_diff)}"> {fmt_pct(overall_diff)}</span></div>
-                    <div class="summary-label">Overall Score</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{gsc_clicks:,}<span style="font-size: 0.4em;" class="{trend_class(gsc_clicks_diff)}"> {fmt_pct(gsc_clicks_pct)}</span></div>
-                    <div class="summary-label">Search Clicks</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{ga4_sessions:,}<span style="font-size: 0.4em;" class="{trend_class(ga4_sessions_diff)}"> {fmt_pct(ga4_sessions_pct)}</span></div>
-                    <div class="summary-label">Web Sessions</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-value">{meta_impr:,}<span style="font-size: 0.4em;" class="{trend_class(meta_impr_diff)}"> {fmt_pct(meta_impr_pct)}</span></div>
-                    <div class="summary-label">Social Impressions</div>
-                </div>
-            </div>
-        </div>
+### Overall Scores
+- **Overall Score**: {overall:.1f}/100
+- **Search Visibility**: {search_visibility:.1f}/100
+- **GA4 Performance**: {ga4_performance:.1f}/100
+- **Meta Performance**: {meta_performance:.1f}/100
 
-        <div class="section">
-            <h2 class="section-title">Performance Comparison</h2>
-            <div class="grid-2">
-                <div class="card">
-                    <h2>Search Performance (GSC)</h2>
-                    <table style="width:100%; font-size: 0.9em;">
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Metric</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Clicks</td><td style="text-align:right; padding:12px;">{gsc_clicks:,}</td><td style="text-align:right; padding:12px;">{prev_gsc_clicks:,}</td><td style="text-align:right; padding:12px;" class="{trend_class(gsc_clicks_diff)}">{fmt_pct(gsc_clicks_pct)}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Impressions</td><td style="text-align:right; padding:12px;">{gsc_impr:,}</td><td style="text-align:right; padding:12px;">{prev_gsc_impr:,}</td><td style="text-align:right; padding:12px;">{fmt_num(gsc_impr_diff)}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Avg CTR</td><td style="text-align:right; padding:12px;">{gsc_ctr:.2%}</td><td style="text-align:right; padding:12px;">{prev_gsc_ctr:.2%}</td><td style="text-align:right; padding:12px;">{(gsc_ctr - prev_gsc_ctr) * 100:+.2f}%</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Avg Position</td><td style="text-align:right; padding:12px;">{gsc.get("average_position", 0):.1f}</td><td style="text-align:right; padding:12px;">{prev_gsc.get("average_position", 0):.1f}</td><td style="text-align:right; padding:12px;">{gsc.get("average_position", 0) - prev_gsc.get("average_position", 0):+.1f}</td></tr>
-                    </table>
-                </div>
-                <div class="card">
-                    <h2>Web Analytics (GA4)</h2>
-                    <table style="width:100%; font-size: 0.9em;">
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Metric</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Sessions</td><td style="text-align:right; padding:12px;">{ga4_sessions:,}</td><td style="text-align:right; padding:12px;">{prev_ga4_sessions:,}</td><td style="text-align:right; padding:12px;" class="{trend_class(ga4_sessions_diff)}">{fmt_pct(ga4_sessions_pct)}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Users</td><td style="text-align:right; padding:12px;">{ga4_users:,}</td><td style="text-align:right; padding:12px;">{prev_ga4_users:,}</td><td style="text-align:right; padding:12px;">{ga4_users - prev_ga4_users:+d}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Bounce Rate</td><td style="text-align:right; padding:12px;">{ga4_bounce:.1%}</td><td style="text-align:right; padding:12px;">{prev_ga4_bounce:.1%}</td><td style="text-align:right; padding:12px;" class="{trend_class(bounce_diff, True)}">{bounce_diff:+.1f}%</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Conversions</td><td style="text-align:right; padding:12px;">{ga4_conversions}</td><td style="text-align:right; padding:12px;">{prev_ga4_conversions}</td><td style="text-align:right; padding:12px;">{ga4_conversions - prev_ga4_conversions:+d}</td></tr>
-                    </table>
-                </div>
-            </div>
-            <div class="grid-2" style="margin-top: 20px;">
-                <div class="card">
-                    <h2>Social Media (Meta)</h2>
-                    <table style="width:100%; font-size: 0.9em;">
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Metric</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Impressions</td><td style="text-align:right; padding:12px;">{meta_impr:,}</td><td style="text-align:right; padding:12px;">{prev_meta_impr:,}</td><td style="text-align:right; padding:12px;" class="{trend_class(meta_impr_diff)}">{fmt_pct(meta_impr_pct)}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Engagement Rate</td><td style="text-align:right; padding:12px;">{meta_er:.2%}</td><td style="text-align:right; padding:12px;">{prev_meta_er:.2%}</td><td style="text-align:right; padding:12px;">{(meta_er - prev_meta_er) * 100:+.2f}%</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Page Fans</td><td style="text-align:right; padding:12px;">{meta.get("total_fans", 0):,}</td><td style="text-align:right; padding:12px;">{prev_meta.get("total_fans", 0):,}</td><td style="text-align:right; padding:12px;">{meta.get("total_fans", 0) - prev_meta.get("total_fans", 0):+d}</td></tr>
-                    </table>
-                </div>
-                <div class="card">
-                    <h2>Executive Scorecard</h2>
-                    <table style="width:100%; font-size: 0.9em;">
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Score</td><td style="text-align:right; padding:12px;">Current</td><td style="text-align:right; padding:12px;">Previous</td><td style="text-align:right; padding:12px;">Change</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Overall</td><td style="text-align:right; padding:12px;"><strong>{overall:.1f}</strong></td><td style="text-align:right; padding:12px;"><strong>{prev_overall:.1f}</strong></td><td style="text-align:right; padding:12px;" class="{trend_class(overall_diff)}"><strong>{fmt_pct(overall_diff)}</strong></td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Search Visibility</td><td style="text-align:right; padding:12px;">{scores.get("search_visibility", 0):.1f}</td><td style="text-align:right; padding:12px;">{prev_scores.get("search_visibility", 0):.1f}</td><td style="text-align:right; padding:12px;">{scores.get("search_visibility", 0) - prev_scores.get("search_visibility", 0):+.1f}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">GA4 Performance</td><td style="text-align:right; padding:12px;">{scores.get("ga4_performance", 0):.1f}</td><td style="text-align:right; padding:12px;">{prev_scores.get("ga4_performance", 0):.1f}</td><td style="text-align:right; padding:12px;">{scores.get("ga4_performance", 0) - prev_scores.get("ga4_performance", 0):+.1f}</td></tr>
-                        <tr style="border-bottom: 1px solid #eee;"><td style="padding:12px;">Meta Performance</td><td style="text-align:right; padding:12px;">{scores.get("meta_performance", 0):.1f}</td><td style="text-align:right; padding:12px;">{prev_scores.get("meta_performance", 0):.1f}</td><td style="text-align:right; padding:12px;">{scores.get("meta_performance", 0) - prev_scores.get("meta_performance", 0):+.1f}</td></tr>
-                    </table>
-                </div>
-            </div>
-        </div>
+---
 
-        <div class="section">
-            <h2 class="section-title">Key Takeaways & Executive Summary</h2>
-            {self._generate_takeaways(gsc, prev_gsc, ga4, prev_ga4, meta, prev_meta, scores, prev_scores)}
-        </div>
-        '''
-        return html
+## Your Task
 
-    def _generate_takeaways(
-        self, gsc, prev_gsc, ga4, prev_ga4, meta, prev_meta, scores, prev_scores
-    ) -> str:
-        """Generate executive takeaways based on comparison"""
-        takeaways = []
-
-        gsc_diff = gsc.get("total_clicks", 0) - prev_gsc.get("total_clicks", 0)
-        if gsc_diff > 0:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Positive Trend:</strong> Search clicks increased by {gsc_diff} (+{(gsc_diff / max(prev_gsc.get("total_clicks", 1), 1)) * 100:.1f}%) compared to previous month.
-            </div>""")
-        elif gsc_diff < 0:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Attention Needed:</strong> Search clicks decreased by {abs(gsc_diff)} ({abs(gsc_diff) / max(prev_gsc.get("total_clicks", 1), 1) * 100:.1f}%) compared to previous month. Review SEO strategy.
-            </div>""")
-
-        ga4_diff = ga4.get("total_sessions", 0) - prev_ga4.get("total_sessions", 0)
-        if ga4_diff > 0:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Growth:</strong> Web traffic increased by {ga4_diff} sessions (+{(ga4_diff / max(prev_ga4.get("total_sessions", 1), 1)) * 100:.1f}%) month-over-month.
-            </div>""")
-
-        bounce_change = ga4.get("bounce_rate", 0) - prev_ga4.get("bounce_rate", 0)
-        if bounce_change < -0.05:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Improved Engagement:</strong> Bounce rate improved by {abs(bounce_change) * 100:.1f} percentage points, indicating better user engagement.
-            </div>""")
-        elif bounce_change > 0.05:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Engagement Warning:</strong> Bounce rate increased by {bounce_change * 100:.1f} percentage points. Investigate user experience issues.
-            </div>""")
-
-        conv_curr = ga4.get("conversions", 0)
-        conv_prev = prev_ga4.get("conversions", 0)
-        if conv_curr > conv_prev:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Conversion Growth:</strong> Conversions increased from {conv_prev} to {conv_curr} (+{conv_curr - conv_prev}).
-            </div>""")
-        elif conv_curr == 0 and conv_prev == 0:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Critical Gap:</strong> No conversions tracked in either period. Immediate action required.
-            </div>""")
+Based on the analytics data above, create a comprehensive **Strategic Action Plan** with the following sections:
+
+### 1. Executive Summary (3-4 sentences)
+Brief overview of current performance and key priority areas.
 
-        meta_diff = meta.get("total_impressions", 0) - prev_meta.get(
-            "total_impressions", 0
-        )
-        if meta_diff > 0:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #0d6efd;">
-                <strong>Social Growth:</strong> Social media impressions increased by {(meta_diff / max(prev_meta.get("total_impressions", 1), 1)) * 100:.1f}%.
-            </div>""")
+### 2. Critical Issues (Immediate Action Required)
+List the top 3 issues that need immediate attention within 7 days.
+For each issue:
+- **Issue**: Description
+- **Impact**: Why this matters
+- **Action**: Specific step to take
 
-        overall_diff = scores.get("overall", 0) - prev_scores.get("overall", 0)
-        if overall_diff > 2:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #198754;">
-                <strong>Overall Improvement:</strong> Overall performance score improved by {overall_diff:.1f} points. Strong momentum.
-            </div>""")
-        elif overall_diff < -2:
-            takeaways.append(f"""<div class="insight" style="border-left-color: #dc3545;">
-                <strong>Performance Decline:</strong> Overall score dropped by {abs(overall_diff):.1f} points. Review all channels.
-            </div>""")
-
-        return (
-            "\n".join(takeaways)
-            if takeaways
-            else '<div class="insight">No significant changes detected between periods.</div>'
-        )
+### 3. Short-Term Improvements (30 Days)
+List 5 specific actions to improve performance in the next 30 days.
+For each:
+- **Action**: Specific task
+- **Expected Impact**: What metric will improve
+- **Effort**: Low/Medium/High
 
-    def _generate_ai_html_insights(
-        self, ai_insights: Dict, gsc: Dict, ga4: Dict, meta: Dict, scores: Dict
-    ) -> str:
-        """Generate HTML for AI-powered insights"""
-        if not ai_insights:
-            return self._generate_dynamic_insights(gsc, ga4, meta, scores)
+### 4. Long-Term Strategy (Quarterly)
+List 3-4 strategic initiatives for the next quarter.
+For each:
+- **Initiative**: Description
+- **Resources Needed**: What you need
+- **Success Metric**: How to measure
 
-        insights_html = ""
+### 5. Quick Wins
+List 3-5 quick wins that can be implemented immediately with minimal effort.
 
-        # Add AI-generated insights
-        if "insights" in ai_insights:
-            for i, insight in enumerate(ai_insights.get("insights", [])):
-                color = (
-                    "#198754"
-                    if i == 0
-                    else "#0d6efd"
-                    if i == 1
-                    else "#ffc107"
-                    if i == 2
-                    else "#7a7a7a"
-                )
-                insights_html += f"""<div class="insight" style="border-left-color: {color};">
-                    {insight}
-                </div>"""
+---
 
-        # Add AI-generated recommendations
-        if "recommendations" in ai_insights:
-            for rec in ai_insights.get("recommendations", []):
-                priority = rec.get("priority", "Medium").lower()
-                priority_class = (
-                    "high"
-                    if priority in ["critical", "high"]
-                    else "growth"
-                    if priority == "growth"
-                    else ""
-                )
-                color = (
-                    "#dc3545"
-                    if priority == "critical"
-                    else "#ffc107"
-                    if priority == "high"
-                    else "#198754"
-                )
-                insights_html += f"""<div class="recommendation {priority_class}" style="border-left-color: {color};">
-                    <div class="rec-priority">{rec.get("priority", "Medium").upper()} PRIORITY</div>
-                    <div class="rec-title">{rec.get("title", "")}</div>
-                    <div class="rec-desc">{rec.get("description", "")}</div>
-                    <div class="rec-action"><strong>Recommended Action:</strong> {rec.get("action", rec.get("description", ""))}</div>
-                </div>"""
+## Important Guidelines
 
-        return insights_html
+1. **Be Specific**: Don't say "improve SEO" - say "optimize title tags for keywords X, Y, Z"
+2. **Prioritize**: Focus on highest impact items first
+3. **Be Realistic**: Consider the data - if bounce rate is 70%, focus on user experience
+4. **No Emojis**: Use professional language
+5. **Data-Driven**: Reference specific numbers from the report
 
-    def _get_gsc_recommendations(self, gsc: Dict) -> List[Dict]:
-        """Generate GSC-specific recommendations"""
-        recs = []
-        if gsc.get("average_position", 0) > 5:
-            recs.append(
-                {
-                    "priority": "High",
-                    "title": "Improve Search Rankings",
-                    "description": f"Average position is {gsc.get('average_position', 0):.1f}. Focus on content optimization and building backlinks to reach top 3.",
-                }
-            )
-        if gsc.get("average_ctr", 0) < 0.03:
-            recs.append(
-                {
-                    "priority": "High",
-                    "title": "Improve CTR",
-                    "description": f"CTR is {gsc.get('average_ctr', 0):.2%}. Optimize title tags and meta descriptions with power words.",
-                }
-            )
-        if gsc.get("positions_4_10", 0) > 0:
-            recs.append(
-                {
-                    "priority": "Medium",
-                    "title": "Optimize Page 1 Keywords",
-                    "description": f"{gsc.get('positions_4_10', 0)} queries ranking 4-10. Small improvements can boost these to top 3.",
-                }
-            )
-        if not recs:
-            recs.append(
-                {
-                    "priority": "Low",
-                    "title": "Maintain Performance",
-                    "description": "SEO metrics look good. Continue current strategy and monitor trends.",
-                }
-            )
-        return recs
+---
 
-    def _get_ga4_recommendations(self, ga4: Dict) -> List[Dict]:
-        """Generate GA4-specific recommendations"""
-        recs = []
-        if ga4.get("bounce_rate", 0) > 0.5:
-            recs.append(
-                {
-                    "priority": "High",
-                    "title": "Reduce Bounce Rate",
-                    "description": f"Bounce rate is {ga4.get('bounce_rate', 0):.1%}. Improve page speed, add engaging content, and ensure mobile responsiveness.",
-                }
-            )
-        if ga4.get("conversions", 0) == 0:
-            recs.append(
-                {
-                    "priority": "High",
-                    "title": "Set Up Conversions",
-                    "description": "No conversions tracked. Set up conversion events in GA4 for key actions (signups, purchases, form submissions).",
-                }
-            )
-        if ga4.get("total_sessions", 0) < 100:
-            recs.append(
-                {
-                    "priority": "Medium",
-                    "title": "Increase Traffic",
-                    "description": f"Only {ga4.get('total_sessions', 0)} sessions. Improve SEO and consider paid traffic to increase visitors.",
-                }
-            )
-        if not recs:
-            recs.append(
-                {
-                    "priority": "Low",
-                    "title": "Maintain Performance",
-                    "description": "Web analytics look healthy. Continue monitoring and optimizing.",
-                }
-            )
-        return recs
+## Output Format
 
-    def _get_meta_recommendations(self, meta: Dict) -> List[Dict]:
-        """Generate Meta-specific recommendations"""
-        recs = []
-        if meta.get("engagement_rate", 0) < 0.03:
-            recs.append(
-                {
-                    "priority": "High",
-                    "title": "Boost Engagement",
-                    "description": f"Engagement rate is {meta.get('engagement_rate', 0):.2%}. Post more videos, use polls, and ask questions.",
-                }
-            )
-        if meta.get("total_impressions", 0) < 10000:
-            recs.append(
-                {
-                    "priority": "Medium",
-                    "title": "Increase Reach",
-                    "description": "Low impressions. Post more consistently and use relevant hashtags.",
-                }
-            )
-        recs.append(
-            {
-                "priority": "Medium",
-                "title": "Content Strategy",
-                "description": "Mix of content types: educational posts, behind-the-scenes, customer testimonials, and promotional content.",
-            }
-        )
-        if not recs:
-            recs.append(
-                {
-                    "priority": "Low",
-                    "title": "Maintain Performance",
-                    "description": "Social metrics look good. Continue engaging with your audience.",
-                }
-            )
-        return recs
+Provide your response in clean markdown format with clear headings. Do not use bullet emojis. Use dashes or numbers instead.
+
+Begin your analysis now.
+"""
 
 
 def main():
     """Main entry point"""
-    import calendar as cal
-    from datetime import timedelta
+    parser = argparse.ArgumentParser(description="Data Analyst Agent")
+    parser.add_argument("site_url", nargs="?")
+    parser.add_argument("--schedule", nargs="?", const="daily")
+    parser.add_argument("--report", default="standard")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--start")
+    parser.add_argument("--end")
+    parser.add_argument(
+        "--channels",
+        type=lambda value: [c.strip() for c in value.split(",")],
+        default=["gsc", "ga4", "meta"],
+    )
+    args = parser.parse_args()
 
     # Check for scheduled analysis
-    if "--schedule" in sys.argv:
-        try:
-            schedule_idx = sys.argv.index("--schedule")
-            schedule = (
-                sys.argv[schedule_idx + 1]
-                if schedule_idx + 1 < len(sys.argv)
-                else "daily"
-            )
-        except:
-            schedule = "daily"
-
+    if args.schedule:
         # Get website URL from args or use default
-        site_url = "https://www.skinessentialsbyher.com"
-        if len(sys.argv) > 2 and not sys.argv[2].startswith("--"):
-            site_url = sys.argv[2]
+        site_url = args.site_url or "https://www.skinessentialsbyher.com"
 
         analyst = DataAnalyst()
-        analyst.run_scheduled_analysis(site_url, schedule)
+        analyst.run_scheduled_analysis(site_url, args.schedule)
         return
 
-    # Check for report type
-    report_type = "standard"  # default
-    if "--report" in sys.argv:
-        try:
-            report_type = sys.argv[sys.argv.index("--report") + 1]
-        except:
-            report_type = "standard"
+    report_type = args.report
 
-    if len(sys.argv) < 2:
+    if not args.site_url:
         print(
             "Usage: python data_analyst.py <website_url> [--days 30] [--channels gsc,ga4,meta] [--report standard|weekly|monthly]\n"
             "       python data_analyst.py --schedule daily [website_url]"
@@ -3591,15 +4269,19 @@ def main():
         print("  python data_analyst.py --schedule monthly")
         sys.exit(1)
 
-    site_url = sys.argv[1]
-    days = 30
-    channels = ["gsc", "ga4", "meta"]
+    site_url = args.site_url
+    days = args.days
+    channels = args.channels
     comparison_data = None
 
+    # One clock read and home lookup for every date and path below
+    now = datetime.now()
+    desktop_dir = os.path.join(os.path.expanduser("~"), "Desktop")
+
     # Handle different report types
     if report_type == "weekly":
         # Monday to Saturday of current week
-        today = datetime.now()
+        today = now
         # Find Monday of current week
         monday = today - timedelta(days=today.weekday())
         # Saturday is monday + 5 days
@@ -3610,76 +4292,33 @@ def main():
         print(f"Weekly Report: {start_date} to {end_date}")
 
     elif report_type == "monthly" or report_type == "monthly-running":
-        # Current month with comparison to previous month
-        today = datetime.now()
-        first_day_current = today.replace(day=1)
+        # Current month with comparison to previous month (same number of days)
+        running = report_type == "monthly-running"
+        first, last, prev_first, prev_last = _month_range(now, running)
+        start_date, end_date, prev_start, prev_end = (
+            d.strftime("%Y-%m-%d") for d in (first, last, prev_first, prev_last)
+        )
+        days = (last - first).days + 1
 
-        if report_type == "monthly-running":
+        if running:
             # Monthly Running: 1st of month to TODAY (not end of month)
-            last_day_current = today
             print(
-                f"Monthly Running Report: {first_day_current.strftime('%Y-%m-%d')} to {today.strftime('%Y-%m-%d')} (Current month to date)"
+                f"Monthly Running Report: {start_date} to {end_date} (Current month to date)"
             )
         else:
             # Full Monthly: 1st of month to end of month
-            last_day_current = today.replace(
-                day=cal.monthrange(today.year, today.month)[1]
-            )
-            print(
-                f"Monthly Report: {first_day_current.strftime('%Y-%m-%d')} to {last_day_current.strftime('%Y-%m-%d')} (Full month)"
-            )
-
-        # Previous month (same number of days as current period)
-        if today.month == 1:
-            first_day_prev = today.replace(year=today.year - 1, month=12, day=1)
-        else:
-            first_day_prev = today.replace(month=today.month - 1, day=1)
-
-        # Previous period has same number of days
-        days_in_period = (last_day_current - first_day_current).days + 1
-        last_day_prev = first_day_prev + timedelta(days=days_in_period - 1)
-
-        start_date = first_day_current.strftime("%Y-%m-%d")
-        end_date = last_day_current.strftime("%Y-%m-%d")
-        prev_start = first_day_prev.strftime("%Y-%m-%d")
-        prev_end = last_day_prev.strftime("%Y-%m-%d")
-
-        days = days_in_period
+            print(f"Monthly Report: {start_date} to {end_date} (Full month)")
         print(f"Comparison Period: {prev_start} to {prev_end}")
 
     else:
-        # Standard report
-        if "--days" in sys.argv:
-            try:
-                days = int(sys.argv[sys.argv.index("--days") + 1])
-            except (ValueError, IndexError):
-                pass
-
-        # Custom date range
-        start_date = None
-        end_date = None
-        if "--start" in sys.argv:
-            try:
-                start_date = sys.argv[sys.argv.index("--start") + 1]
-            except (ValueError, IndexError):
-                pass
-        if "--end" in sys.argv:
-            try:
-                end_date = sys.argv[sys.argv.index("--end") + 1]
-            except (ValueError, IndexError):
-                pass
+        # Standard report, optionally over a custom date range
+        start_date = args.start
+        end_date = args.end
 
         # Override days if custom dates provided
         if start_date and end_date:
             days = None  # Will be calculated from dates
 
-    if "--channels" in sys.argv:
-        try:
-            channels_str = sys.argv[sys.argv.index("--channels") + 1]
-            channels = [c.strip() for c in channels_str.split(",")]
-        except (ValueError, IndexError):
-            pass
-
     analyst = DataAnalyst()
 
     # Test API connections first
@@ -3687,32 +4326,39 @@ def main():
     print("🔌 TESTING API CONNECTIONS")
     print("=" * 60)
 
-    gsc_ok = analyst.authenticate_gsc()
-    ga4_ok = analyst.authenticate_ga4()
-    meta_ok = analyst.authenticate_meta()
+    # Only authenticate the channels this run will fetch
+    use_gsc = "gsc" in channels
+    use_ga4 = "ga4" in channels
+    use_meta = "meta" in channels
+    gsc_ok = analyst.authenticate_gsc() if use_gsc else False
+    ga4_ok = analyst.authenticate_ga4() if use_ga4 else False
+    meta_ok = analyst.authenticate_meta() if use_meta else False
 
     print("\n" + "=" * 60)
     print("📡 CONNECTION STATUS")
     print("=" * 60)
-    print(
-        f"{'✓' if gsc_ok else '✗'} Google Search Console: {'Connected' if gsc_ok else 'FAILED'}"
-    )
-    print(
-        f"{'✓' if ga4_ok else '✗'} Google Analytics 4:  {'Connected' if ga4_ok else 'FAILED'}"
-    )
-    print(
-        f"{'✓' if meta_ok else '✗'} Meta/Facebook:     {'Connected' if meta_ok else 'FAILED'}"
-    )
+    if use_gsc:
+        print(
+            f"{'✓' if gsc_ok else '✗'} Google Search Console: {'Connected' if gsc_ok else 'FAILED'}"
+        )
+    if use_ga4:
+        print(
+            f"{'✓' if ga4_ok else '✗'} Google Analytics 4:  {'Connected' if ga4_ok else 'FAILED'}"
+        )
+    if use_meta:
+        print(
+            f"{'✓' if meta_ok else '✗'} Meta/Facebook:     {'Connected' if meta_ok else 'FAILED'}"
+        )
 
     if not gsc_ok and not ga4_ok and not meta_ok:
         print("\n❌ All API connections failed. Please check credentials.")
         sys.exit(1)
 
-    if not gsc_ok:
+    if use_gsc and not gsc_ok:
         print("\n⚠️  Warning: GSC not connected - search data will be unavailable")
-    if not ga4_ok:
+    if use_ga4 and not ga4_ok:
         print("\n⚠️  Warning: GA4 not connected - web analytics will be unavailable")
-    if not meta_ok:
+    if use_meta and not meta_ok:
         print("\n⚠️  Warning: Meta not connected - social data will be unavailable")
 
     print("\n" + "=" * 60)
@@ -3724,12 +4370,28 @@ def main():
         site_url, days, channels, start_date, end_date
     )
 
+    # Headline totals per channel (GA4 reports sessions, not impressions)
+    channel_data = report.get("channels", {}) if report else {}
+    has_data = any(
+        any(
+            _metrics(
+                channel_data.get(c) or {},
+                "total_clicks",
+                "total_impressions",
+                "total_sessions",
+            )
+        )
+        for c in channels
+    )
+
     # If monthly or monthly-running, also get previous month data for comparison
-    if (
+    # (skipped when the current period came back empty)
+    is_monthly = (
         (report_type == "monthly" or report_type == "monthly-running")
         and start_date
         and end_date
-    ):
+    )
+    if is_monthly and has_data:
         print("Fetching previous month data for comparison...")
         prev_report = analyst.generate_unified_report(
             site_url, days, channels, prev_start, prev_end
@@ -3740,12 +4402,19 @@ def main():
             "prev_end": prev_end,
         }
         print(f"Previous period: {prev_start} to {prev_end}")
+    elif is_monthly:
+        print("⚠️  Current period has no channel data - skipping comparison fetch")
 
     if report:
         # Save to historical data
         analyst.save_historical_data(site_url, report)
 
-        output_file = f"data_report_{site_url.replace('https://', '').replace('http://', '').replace('/', '_')}_{datetime.now().strftime('%Y%m%d')}.json"
+        # Output names: the data report keeps "www.", the dashboards drop it
+        host = _URL_SCHEME.sub("", site_url)
+        site_name = host.replace("www.", "").replace("/", "")
+        today_tag = now.strftime("%Y%m%d")
+
+        output_file = f"data_report_{host.replace('/', '_')}_{today_tag}.json"
         analyst.export_report(report, output_file)
 
         # Get trends and recommendations
@@ -3753,15 +4422,7 @@ def main():
         growth_recs = analyst.generate_growth_recommendations(site_url, trends)
 
         # Generate HTML dashboard with comparison if monthly
-        site_name = (
-            site_url.replace("https://", "")
-            .replace("http://", "")
-            .replace("www.", "")
-            .replace("/", "")
-        )
-        html_dashboard_file = (
-            f"dashboard_{site_name}_{datetime.now().strftime('%Y%m%d')}.html"
-        )
+        html_dashboard_file = f"dashboard_{site_name}_{today_tag}.html"
         analyst.export_html_dashboard(
             report,
             html_dashboard_file,
@@ -3775,10 +4436,8 @@ def main():
         )
 
         # Copy HTML to Desktop folder
-        import shutil
-
-        desktop_report_dir = os.path.expanduser(
-            f"~/Desktop/data-analyst/{site_name}-reports"
+        desktop_report_dir = os.path.join(
+            desktop_dir, "data-analyst", f"{site_name}-reports"
         )
         os.makedirs(desktop_report_dir, exist_ok=True)
 
@@ -3788,27 +4447,34 @@ def main():
         elif report_type == "monthly":
             report_filename = f"monthly-report-{start_date}-to-{end_date}.html"
         else:
-            report_filename = f"dashboard-{datetime.now().strftime('%Y%m%d')}.html"
+            report_filename = f"dashboard-{today_tag}.html"
 
         desktop_html_path = os.path.join(desktop_report_dir, report_filename)
-        shutil.copy2(html_dashboard_file, desktop_html_path)
+        shutil.copyfile(html_dashboard_file, desktop_html_path)
         print(f"\n📁 Report saved to Desktop: {desktop_html_path}")
 
         # Also generate Streamlit dashboard for interactive use
-        st_dashboard_file = (
-            f"dashboard_{site_name}_{datetime.now().strftime('%Y%m%d')}.py"
-        )
-        analyst.export_streamlit_dashboard(
+        st_dashboard_file = f"dashboard_{site_name}_{today_tag}.py"
+        st_exported = analyst.export_streamlit_dashboard(
             report, st_dashboard_file, trends, growth_recs
         )
 
-        # Also generate a consistent "latest" dashboard that can always be run
+        # Also point a consistent "latest" dashboard at it that can always be run
         latest_dashboard = "dashboard_latest.py"
-        analyst.export_streamlit_dashboard(
-            report, latest_dashboard, trends, growth_recs
-        )
-        print(f"✅ Latest dashboard saved to: {latest_dashboard}")
-        print(f"   Run with: streamlit run {latest_dashboard}")
+        if st_exported and os.path.exists(st_dashboard_file):
+            try:
+                latest_tmp = latest_dashboard + ".tmp"
+                if os.path.lexists(latest_tmp):
+                    os.remove(latest_tmp)
+                os.symlink(st_dashboard_file, latest_tmp)
+                os.replace(latest_tmp, latest_dashboard)
+            except OSError:
+                # Symlinks need extra privileges on Windows
+                shutil.copyfile(st_dashboard_file, latest_dashboard)
+            print(f"✅ Latest dashboard saved to: {latest_dashboard}")
+            print(f"   Run with: streamlit run {latest_dashboard}")
+        else:
+            print(f"⚠️  Streamlit export failed - {latest_dashboard} left unchanged")
 
         # Print growth recommendations
         print("\n" + "=" * 60)
@@ -3822,136 +4488,71 @@ def main():
             print(f"   ➡️ Action: {rec.get('action', '')}")
 
         # Run Streamlit dashboard instead of HTML
-        import subprocess
-
         print("\n🚀 Opening Streamlit dashboard...")
         st_dashboard_path = os.path.abspath(st_dashboard_file)
+        streamlit_bin = shutil.which("streamlit")
 
-        # Run streamlit in headless mode (no browser auto-open, but server starts)
-        subprocess.Popen(
-            [
-                "streamlit",
-                "run",
-                st_dashboard_path,
-                "--server.headless",
-                "true",
-                "--browser.gatherUsageStats",
-                "false",
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,
-        )
-
-        print(f"   Streamlit dashboard starting at: http://localhost:8501")
+        if streamlit_bin:
+            # Run streamlit in headless mode (no browser auto-open, but server starts).
+            # An absolute executable skips the PATH walk in the child, and all
+            # three std streams are detached so the server holds none of ours.
+            subprocess.Popen(
+                [
+                    streamlit_bin,
+                    "run",
+                    st_dashboard_path,
+                    "--server.headless",
+                    "true",
+                    "--browser.gatherUsageStats",
+                    "false",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            print(f"   Streamlit dashboard starting at: http://localhost:8501")
+        else:
+            print("   ⚠️  streamlit not found on PATH - start the dashboard manually")
         print(f"   Dashboard file: {st_dashboard_path}")
 
         # Generate LLM prompt file
-        desktop_prompt_dir = os.path.expanduser(f"~/Desktop/analytics/{site_name}")
+        desktop_prompt_dir = os.path.join(desktop_dir, "analytics", site_name)
         os.makedirs(desktop_prompt_dir, exist_ok=True)
 
         # Get data from report
         report_channels = report.get("channels", {})
         report_scores = report.get("scores", {})
+        gsc = report_channels.get("gsc") or {}
+        ga4 = report_channels.get("ga4") or {}
+        meta = report_channels.get("meta") or {}
 
         # Create filled prompt
-        gsc_data = f"Total Clicks: {report_channels.get('gsc', {}).get('total_clicks', 0)}\nTotal Impressions: {report_channels.get('gsc', {}).get('total_impressions', 0)}\nAvg CTR: {report_channels.get('gsc', {}).get('average_ctr', 0):.2%}\nAvg Position: {report_channels.get('gsc', {}).get('average_position', 0):.1f}"
-        ga4_data = f"Total Sessions: {report_channels.get('ga4', {}).get('total_sessions', 0)}\nTotal Users: {report_channels.get('ga4', {}).get('total_users', 0)}\nBounce Rate: {report_channels.get('ga4', {}).get('bounce_rate', 0):.1%}\nConversions: {report_channels.get('ga4', {}).get('conversions', 0)}"
-        meta_data = f"Total Impressions: {report_channels.get('meta', {}).get('total_impressions', 0):,}\nEngaged Users: {report_channels.get('meta', {}).get('total_engaged_users', 0):,}\nPage Fans: {report_channels.get('meta', {}).get('total_fans', 0):,}\nEngagement Rate: {report_channels.get('meta', {}).get('engagement_rate', 0):.2%}"
-
-        prompt_content = f"""# Analytics Report - LLM Action Prompt
-
-You are a senior digital marketing strategist. Analyze the following website analytics data and provide actionable recommendations.
-
-## Report Details
-- **Website**: {site_url}
-- **Report Type**: {report_type}
-- **Period**: {start_date} to {end_date}
-- **Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M")}
-- **Author**: Vincent John Rodriguez
-
----
-
-## Current Performance Data
-
-### Google Search Console (GSC) - Search Performance
-```
-{gsc_data}
-```
-
-### Google Analytics 4 (GA4) - Web Analytics
-```
-{ga4_data}
-```
-
-### Meta/Facebook - Social Performance
-```
-{meta_data}
-```
-
-### Overall Scores
-- **Overall Score**: {report_scores.get("overall", 0):.1f}/100
-- **Search Visibility**: {report_scores.get("search_visibility", 0):.1f}/100
-- **GA4 Performance**: {report_scores.get("ga4_performance", 0):.1f}/100
-- **Meta Performance**: {report_scores.get("meta_performance", 0):.1f}/100
-
----
-
-## Your Task
-
-Based on the analytics data above, create a comprehensive **Strategic Action Plan** with the following sections:
-
-### 1. Executive Summary (3-4 sentences)
-Brief overview of current performance and key priority areas.
-
-### 2. Critical Issues (Immediate Action Required)
-List the top 3 issues that need immediate attention within 7 days.
-For each issue:
-- **Issue**: Description
-- **Impact**: Why this matters
-- **Action**: Specific step to take
-
-### 3. Short-Term Improvements (30 Days)
-List 5 specific actions to improve performance in the next 30 days.
-For each:
-- **Action**: Specific task
-- **Expected Impact**: What metric will improve
-- **Effort**: Low/Medium/High
-
-### 4. Long-Term Strategy (Quarterly)
-List 3-4 strategic initiatives for the next quarter.
-For each:
-- **Initiative**: Description
-- **Resources Needed**: What you need
-- **Success Metric**: How to measure
-
-### 5. Quick Wins
-List 3-5 quick wins that can be implemented immediately with minimal effort.
-
----
-
-## Important Guidelines
-
-1. **Be Specific**: Don't say "improve SEO" - say "optimize title tags for keywords X, Y, Z"
-2. **Prioritize**: Focus on highest impact items first
-3. **Be Realistic**: Consider the data - if bounce rate is 70%, focus on user experience
-4. **No Emojis**: Use professional language
-5. **Data-Driven**: Reference specific numbers from the report
-
----
-
-## Output Format
-
-Provide your response in clean markdown format with clear headings. Do not use bullet emojis. Use dashes or numbers instead.
+        gsc_data = f"Total Clicks: {gsc.get('total_clicks', 0)}\nTotal Impressions: {gsc.get('total_impressions', 0)}\nAvg CTR: {gsc.get('average_ctr', 0):.2%}\nAvg Position: {gsc.get('average_position', 0):.1f}"
+        ga4_data = f"Total Sessions: {ga4.get('total_sessions', 0)}\nTotal Users: {ga4.get('total_users', 0)}\nBounce Rate: {ga4.get('bounce_rate', 0):.1%}\nConversions: {ga4.get('conversions', 0)}"
+        meta_data = f"Total Impressions: {meta.get('total_impressions', 0):,}\nEngaged Users: {meta.get('total_engaged_users', 0):,}\nPage Fans: {meta.get('total_fans', 0):,}\nEngagement Rate: {meta.get('engagement_rate', 0):.2%}"
 
-Begin your analysis now.
-"""
+        prompt_content = _PROMPT_TEMPLATE.format_map(
+            {
+                "site_url": site_url,
+                "report_type": report_type,
+                "start_date": start_date,
+                "end_date": end_date,
+                "generated": now.strftime("%Y-%m-%d %H:%M"),
+                "gsc_data": gsc_data,
+                "ga4_data": ga4_data,
+                "meta_data": meta_data,
+                "overall": report_scores.get("overall", 0),
+                "search_visibility": report_scores.get("search_visibility", 0),
+                "ga4_performance": report_scores.get("ga4_performance", 0),
+                "meta_performance": report_scores.get("meta_performance", 0),
+            }
+        )
 
         # Save prompt file
         prompt_filename = f"llm-prompt-{start_date}-to-{end_date}.md"
         prompt_path = os.path.join(desktop_prompt_dir, prompt_filename)
-        with open(prompt_path, "w") as f:
-            f.write(prompt_content)
+        Path(prompt_path).write_text(prompt_content, encoding="utf-8")
 
         print(f"📝 LLM Prompt saved to: {prompt_path}")
 